@@ -0,0 +1,152 @@
+"""On-disk cache for GitLab API responses."""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIRNAME = "gitlab-search"
+# Entries not stored or revalidated for this many seconds are deleted
+CACHE_MAX_AGE = 7 * 24 * 3600
+
+def default_cache_dir() -> Path:
+    """Get cache directory (XDG_CACHE_HOME or ~/.cache).
+
+    Returns:
+        Path to gitlab-search cache directory
+    """
+    xdg_cache_home = os.getenv("XDG_CACHE_HOME")
+    if xdg_cache_home:
+        return Path(xdg_cache_home) / CACHE_DIRNAME
+    return Path(os.getenv("HOME", "")) / ".cache" / CACHE_DIRNAME
+
+@dataclass
+class CachedResponse:
+    """Cached successful GET response."""
+    headers: dict[str, str]
+    body: bytes
+    stored_at: float
+
+    @property
+    def etag(self) -> str | None:
+        """ETag header of the cached response, if any."""
+        for name, value in self.headers.items():
+            if name.lower() == "etag":
+                return value
+        return None
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Check if response is younger than ttl seconds."""
+        return time.time() - self.stored_at < ttl
+
+class ResponseCache:
+    """Cache of GET responses keyed by URL, one JSON file per entry."""
+
+    def __init__(self, directory: Path, namespace: str, max_age: float = CACHE_MAX_AGE) -> None:
+        """Initialize response cache.
+
+        Entries may hold private group and project listings, so the
+        directory and entry files are only accessible by their owner.
+
+        Args:
+            directory: Directory holding cache entries
+            namespace: Secret distinguishing entries of different users,
+                e.g. the access token; only its hash is stored
+            max_age: Seconds after which an entry that was not stored
+                again is deleted
+        """
+        self.directory = directory
+        self.namespace = namespace
+        self.max_age = max_age
+        self._pruned = False
+        self._prune_lock = threading.Lock()
+
+    def _entry_path(self, url: str) -> Path:
+        key = hashlib.sha256(f"{self.namespace}\0{url}".encode("utf-8")).hexdigest()
+        return self.directory / f"{key}.json"
+
+    def get(self, url: str) -> CachedResponse | None:
+        """Load cached response for URL.
+
+        Args:
+            url: Requested URL
+
+        Returns:
+            Cached response, or None if missing or unreadable
+        """
+        path = self._entry_path(url)
+        try:
+            entry = json.loads(path.read_bytes())
+            cached = CachedResponse(
+                headers=entry["headers"],
+                body=entry["body"].encode("utf-8"),
+                stored_at=entry["stored_at"],
+            )
+        except (OSError, ValueError, KeyError):
+            return None
+        if cached.is_fresh(self.max_age):
+            return cached
+        path.unlink(missing_ok=True)
+        return None
+
+    def put(self, url: str, headers: Mapping[str, str], body: bytes) -> None:
+        """Store response for URL.
+
+        Args:
+            url: Requested URL
+            headers: Response headers
+            body: Response body (UTF-8 encoded)
+        """
+        path = self._entry_path(url)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            entry = {
+                "headers": dict(headers),
+                "body": body.decode("utf-8"),
+                "stored_at": time.time(),
+            }
+            self._prepare_directory()
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(json.dumps(entry))
+                os.replace(tmp_path, path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+        except (OSError, UnicodeDecodeError) as e:
+            logger.debug("Failed to cache response for %s: %s", url, e)
+
+    def _prepare_directory(self) -> None:
+        """Create private cache directory and delete expired entries once."""
+        with self._prune_lock:
+            if self._pruned:
+                return
+            self._pruned = True
+            self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # Directory may have been created with a wider mode before
+            self.directory.chmod(0o700)
+            self.prune()
+
+    def prune(self) -> None:
+        """Delete entries and leftover temporary files older than max_age."""
+        expires = time.time() - self.max_age
+        try:
+            paths = list(self.directory.iterdir())
+        except OSError:
+            return
+        for path in paths:
+            if path.suffix not in (".json", ".tmp"):
+                continue
+            try:
+                if path.stat().st_mtime < expires:
+                    path.unlink()
+            except OSError as e:
+                logger.debug("Failed to delete expired cache entry %s: %s", path, e)
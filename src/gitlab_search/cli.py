@@ -1,9 +1,11 @@
 """Command-line interface for gitlab-search."""
 
-import asyncio
+import functools
 import logging
 import sys
+from collections.abc import Callable
 from importlib.metadata import version
+from typing import TYPE_CHECKING
 
 from .config import (
     CONFIG_FILENAME,
@@ -13,22 +15,28 @@ from .config import (
     resolve_token,
     write_config,
 )
-from .executor import execute_search
-from .gitlab import GitLabClient
-from .output import ColorFormatter, ResultPrinter
 from .parser import ParseError, parse_command
 from .expression import ParsedCommand
 
+if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop
+
 PROGRAM_NAME = "gitlab-search"
-VALID_SCOPES = [
+VALID_SCOPES = frozenset({
     "blobs", "files", "issues", "merge_requests",
     "milestones", "wiki_blobs", "commits", "notes"
-]
+})
+SORTED_VALID_SCOPES = tuple(sorted(VALID_SCOPES))
 
 
-def print_help() -> None:
-    """Print help message."""
-    print(f"""Usage: {PROGRAM_NAME} [OPTIONS] -q QUERY [-q QUERY ...]
+@functools.cache
+def get_help_text() -> str:
+    """Build help message once per process.
+
+    Returns:
+        Help message text
+    """
+    return f"""Usage: {PROGRAM_NAME} [OPTIONS] -q QUERY [-q QUERY ...]
 
 Search for file contents in GitLab repositories using find-like expression syntax.
 
@@ -51,7 +59,7 @@ Project Source Options (can be combined):
 
 Search Scope:
   -s, --scope SCOPES    Comma-separated search scopes (default: blobs)
-                        Choices: {', '.join(sorted(VALID_SCOPES))}
+                        Choices: {', '.join(SORTED_VALID_SCOPES)}
 
 Search Filters:
   -f, --filename FILE   Search only in files matching this pattern
@@ -73,6 +81,9 @@ Connection Options:
   --max-requests N      Max concurrent requests (default: {DEFAULT_MAX_REQUESTS})
   --token TOKEN         GitLab personal access token
   --token-file FILE     Read GitLab token from file (mutually exclusive with --token)
+  --cache               Also cache search and repository tree responses
+                        (group and project listings are always cached, see
+                        cache-ttl)
 
 Environment Variables:
   GITLAB_SEARCH_TOKEN   GitLab token (used if --token/--token-file not provided)
@@ -118,12 +129,27 @@ Examples:
 
   # Search matching files (uses tree endpoint)
   {PROGRAM_NAME} -s files -f "*test*" -P "routes/*"
-""")
+"""
+
+
+def print_help() -> None:
+    """Print help message."""
+    print(get_help_text())
+
+
+@functools.cache
+def get_version() -> str:
+    """Resolve installed package version once per process.
+
+    Returns:
+        Version string
+    """
+    return version(PROGRAM_NAME)
 
 
 def print_version() -> None:
     """Print version."""
-    print(f"{PROGRAM_NAME} {version(PROGRAM_NAME)}")
+    print(f"{PROGRAM_NAME} {get_version()}")
 
 
 def validate_scopes(scopes: list[str]) -> None:
@@ -135,11 +161,11 @@ def validate_scopes(scopes: list[str]) -> None:
     Raises:
         ParseError: If any scope is invalid
     """
-    invalid = set(scopes) - set(VALID_SCOPES)
+    invalid = set(scopes) - VALID_SCOPES
     if invalid:
         raise ParseError(
             f"invalid scope(s): {', '.join(sorted(invalid))} "
-            f"(choose from {', '.join(sorted(VALID_SCOPES))})"
+            f"(choose from {', '.join(SORTED_VALID_SCOPES)})"
         )
 
 
@@ -155,6 +181,8 @@ def run_setup(parsed: ParsedCommand) -> None:
         ignore_cert=parsed.ignore_cert,
         max_requests=parsed.max_requests if parsed.max_requests else DEFAULT_MAX_REQUESTS,
     )
+    from .output import ColorFormatter, ResultPrinter
+
     printer = ResultPrinter(ColorFormatter(parsed.color))
     printer.print_success(
         f"Successfully wrote config to {config_path}, "
@@ -168,6 +196,11 @@ async def run_search(parsed: ParsedCommand) -> None:
     Args:
         parsed: Parsed command with expression and options
     """
+    # Network stack is imported only when searching to keep --help,
+    # --version and --setup fast
+    from .executor import execute_search
+    from .gitlab import GitLabClient
+
     logger = logging.getLogger(__name__)
     config = load_config(parsed.config_file)
 
@@ -178,19 +211,36 @@ async def run_search(parsed: ParsedCommand) -> None:
         config.ignore_cert = True
     if parsed.max_requests is not None:
         config.max_requests = parsed.max_requests
+    if parsed.cache:
+        config.cache_search = True
     config.token = resolve_token(parsed.token, parsed.token_file)
     if not config.token:
         logger.critical("Token not provided")
         sys.exit(1)
 
-    client = GitLabClient(config)
+    async with GitLabClient(config) as client:
+        try:
+            await execute_search(client, parsed)
+        except Exception as e:
+            logger.critical("Search failed")
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+
+def get_event_loop_factory() -> Callable[[], "AbstractEventLoop"] | None:
+    """Get uvloop event loop factory if the optional uvloop is installed.
 
+    Returns:
+        uvloop event loop factory, or None to use the default asyncio loop
+    """
+    if sys.platform == "win32":
+        return None
     try:
-        await execute_search(client, parsed)
-    except Exception as e:
-        logger.critical("Search failed")
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+        import uvloop
+    except ImportError:
+        return None
+    logging.getLogger(__name__).debug("Using uvloop event loop")
+    return uvloop.new_event_loop
 
 
 def configure_logging(debug: bool) -> None:
@@ -256,8 +306,10 @@ def main() -> None:
         print(f"Try '{PROGRAM_NAME} --help' for more information.", file=sys.stderr)
         sys.exit(1)
     else:
+        import asyncio
+
         try:
-            asyncio.run(run_search(parsed))
+            asyncio.run(run_search(parsed), loop_factory=get_event_loop_factory())
         except KeyboardInterrupt:
             print("Received interrupt, exiting")
 
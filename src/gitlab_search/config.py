@@ -1,12 +1,18 @@
 """Configuration management for gitlab-search."""
 
+import functools
 import json
 import os
+import stat
 from dataclasses import dataclass
 from pathlib import Path
 
 DEFAULT_API_URL = "https://gitlab.com/api/v4"
 DEFAULT_MAX_REQUESTS = 15
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_CACHE_TTL = 300
+DEFAULT_REQUESTS_PER_SECOND = 0.0
+DEFAULT_MAX_BODY_BYTES = 0
 DEFAULT_ARCHIVED_FILTER = "all"
 CONFIG_FILENAME = ".gitlab-search-config.json"
 
@@ -17,11 +23,22 @@ class Config:
     token: str | None = None
     ignore_cert: bool = False
     max_requests: int = DEFAULT_MAX_REQUESTS
+    page_size: int = DEFAULT_PAGE_SIZE
+    cache_ttl: int = DEFAULT_CACHE_TTL
+    # Maximum request rate, 0 for no limit
+    requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND
+    # Maximum size of a response body, 0 for no limit
+    max_body_bytes: int = DEFAULT_MAX_BODY_BYTES
+    cache_search: bool = False
     config_path: str = ""
 
+@functools.lru_cache(maxsize=1)
 def find_config_file() -> Path | None:
     """Search for config file in standard locations.
 
+    The result is cached for the lifetime of the process, use
+    find_config_file.cache_clear() to search again.
+
     Searches in order:
     1. Current working directory
     2. User config directory (XDG_CONFIG_HOME)
@@ -31,18 +48,43 @@ def find_config_file() -> Path | None:
         Path to config file if found, None otherwise
     """
     search_paths = [
-        Path.cwd() / CONFIG_FILENAME,
-        Path(os.getenv('XDG_CONFIG_HOME', '')) / CONFIG_FILENAME,
-        Path(os.getenv('HOME', '')) / '.config' / CONFIG_FILENAME,
-        Path("/etc") / CONFIG_FILENAME,
+        os.path.join(os.getcwd(), CONFIG_FILENAME),
+        os.path.join(os.getenv('XDG_CONFIG_HOME', ''), CONFIG_FILENAME),
+        os.path.join(os.getenv('HOME', ''), '.config', CONFIG_FILENAME),
+        os.path.join("/etc", CONFIG_FILENAME),
     ]
 
     for path in search_paths:
-        if path.is_file():
-            return path
+        try:
+            if stat.S_ISREG(os.stat(path).st_mode):
+                return Path(path)
+        except OSError:
+            continue
 
     return None
 
+# Latest parsed config per file path, with its modification time
+_CONFIG_CACHE: dict[str, tuple[int, dict]] = {}
+
+def _read_config_data(config_path: Path) -> dict:
+    """Read and parse config file, reusing the result while it is unchanged.
+
+    Args:
+        config_path: Path to existing config file
+
+    Returns:
+        Parsed config data
+    """
+    path = str(config_path)
+    mtime = config_path.stat().st_mtime_ns
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    data = json.loads(config_path.read_bytes())
+    # Replaces the entry of an older version of the file
+    _CONFIG_CACHE[path] = (mtime, data)
+    return data
+
 def load_config(config_file: str | None = None) -> Config:
     """Load configuration from config file.
 
@@ -60,14 +102,17 @@ def load_config(config_file: str | None = None) -> Config:
 
     data = {}
     if config_path is not None and config_path.is_file():
-        with open(config_path) as f:
-            data = json.load(f)
+        data = _read_config_data(config_path)
 
     return Config(
         api_url=data.get("api-url", DEFAULT_API_URL),
         token=None,
         ignore_cert=data.get("ignore-cert", False),
         max_requests=data.get("max-requests", DEFAULT_MAX_REQUESTS),
+        page_size=data.get("page-size", DEFAULT_PAGE_SIZE),
+        cache_ttl=data.get("cache-ttl", DEFAULT_CACHE_TTL),
+        requests_per_second=data.get("requests-per-second", DEFAULT_REQUESTS_PER_SECOND),
+        max_body_bytes=data.get("max-body-bytes", DEFAULT_MAX_BODY_BYTES),
         config_path=str(config_path),
     )
 
@@ -106,15 +151,18 @@ def write_config(
     if max_requests != DEFAULT_MAX_REQUESTS:
         config_data["max-requests"] = max_requests
 
-    with open(output_path, "w") as f:
-        json.dump(config_data, f, indent=4)
+    # json.dump issues one write per encoded chunk, encode in one go instead
+    output_path.write_text(json.dumps(config_data, indent=4))
 
     return str(output_path)
 
 
+@functools.lru_cache(maxsize=4)
 def resolve_token(token: str | None, token_file: str | None) -> str | None:
     """Resolve GitLab token from various sources.
 
+    The result is cached per process, so the token file is read once.
+
     Priority (highest to lowest):
     1. Direct token argument (--token) or token file (--token-file)
     2. GITLAB_SEARCH_TOKEN environment variable
@@ -129,6 +177,5 @@ def resolve_token(token: str | None, token_file: str | None) -> str | None:
     if token:
         return token
     if token_file:
-        with open(token_file) as f:
-            return f.read().strip()
+        return Path(token_file).read_text().strip()
     return os.getenv("GITLAB_SEARCH_TOKEN")
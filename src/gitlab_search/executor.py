@@ -3,23 +3,167 @@
 import asyncio
 import fnmatch
 import logging
+import operator
+import os
+import re
 from dataclasses import dataclass
-from dataclasses import replace as dataclass_replace
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine, Set
 from typing import Any
+from urllib.parse import quote
 
-from .expression import ExprNode, ParsedCommand, set_universe
+from .expression import (
+    ExprNode,
+    ParsedCommand,
+    QueryNode,
+    get_required_queries,
+)
 from .gitlab import (
     FileCriteriaPatterns,
-    FileResult,
     GitLabClient,
     Project,
     SearchCriteria,
     SearchResult,
+    build_search_query,
+    gather_all,
+    is_wildcard,
 )
+from .output import ColorFormatter, ResultPrinter
 
 logger = logging.getLogger(__name__)
 
 
+def _split_patterns(
+    patterns: list[str],
+) -> tuple[frozenset[str], tuple[str, ...], tuple[str, ...], re.Pattern[str] | None]:
+    """Split fnmatch patterns by the cheapest check that matches them exactly.
+
+    "*" matches any characters including "/", so a pattern that is literal
+    apart from one leading or trailing "*" is a plain suffix or prefix
+    match.
+
+    Args:
+        patterns: fnmatch patterns, already case-normalized
+
+    Returns:
+        Tuple of (literals, prefixes, suffixes, combined regex of the
+        remaining wildcard patterns or None)
+    """
+    literals: set[str] = set()
+    prefixes: list[str] = []
+    suffixes: list[str] = []
+    wildcards: list[str] = []
+    for p in patterns:
+        if not is_wildcard(p):
+            literals.add(p)
+        elif p.startswith("*") and not is_wildcard(p[1:]):
+            suffixes.append(p[1:])
+        elif p.endswith("*") and not is_wildcard(p[:-1]):
+            prefixes.append(p[:-1])
+        else:
+            wildcards.append(fnmatch.translate(p))
+    # Each translated pattern is anchored at its end, so they can be
+    # combined into one alternation matched in a single scan
+    regex = re.compile("|".join(wildcards)) if wildcards else None
+    return frozenset(literals), tuple(prefixes), tuple(suffixes), regex
+
+
+@dataclass
+class ExclusionMatcher:
+    """File exclusion patterns compiled once per search.
+
+    Filename and path patterns are matched by the cheapest exact check:
+    wildcard-free patterns by set membership, patterns with a single
+    leading or trailing "*" (e.g. "*.png", "vendor/*") by suffix or prefix
+    and remaining wildcard patterns by a single precompiled alternation
+    regex per kind.
+    """
+
+    literal_names: frozenset[str] = frozenset()
+    name_prefixes: tuple[str, ...] = ()
+    name_suffixes: tuple[str, ...] = ()
+    name_pattern: re.Pattern[str] | None = None
+    extensions: tuple[str, ...] = ()
+    literal_paths: frozenset[str] = frozenset()
+    path_prefixes: tuple[str, ...] = ()
+    path_suffixes: tuple[str, ...] = ()
+    path_pattern: re.Pattern[str] | None = None
+
+    @classmethod
+    def from_patterns(
+        cls,
+        exclude_filenames: list[str],
+        exclude_extensions: list[str],
+        exclude_paths: list[str],
+    ) -> "ExclusionMatcher":
+        """Create matcher from exclusion pattern lists.
+
+        Args:
+            exclude_filenames: List of filename patterns to exclude (supports wildcards)
+            exclude_extensions: List of extensions to exclude
+            exclude_paths: List of path patterns to exclude (supports wildcards)
+        """
+        literal_names, name_prefixes, name_suffixes, name_pattern = _split_patterns(
+            [os.path.normcase(p) for p in exclude_filenames]
+        )
+        literal_paths, path_prefixes, path_suffixes, path_pattern = _split_patterns(
+            [os.path.normcase(p) for p in exclude_paths]
+        )
+        return cls(
+            literal_names=literal_names,
+            name_prefixes=name_prefixes,
+            name_suffixes=name_suffixes,
+            name_pattern=name_pattern,
+            extensions=tuple(
+                ext if ext.startswith(".") else f".{ext}" for ext in exclude_extensions
+            ),
+            literal_paths=literal_paths,
+            path_prefixes=path_prefixes,
+            path_suffixes=path_suffixes,
+            path_pattern=path_pattern,
+        )
+
+    def has_any(self) -> bool:
+        """Check if any exclusion pattern is set."""
+        return bool(
+            self.literal_names or self.name_prefixes or self.name_suffixes
+            or self.name_pattern or self.extensions
+            or self.literal_paths or self.path_prefixes or self.path_suffixes
+            or self.path_pattern
+        )
+
+    def excluded(self, filename: str, path: str | None) -> bool:
+        """Check if a file matches any exclusion pattern.
+
+        Args:
+            filename: The filename to check
+            path: The full path (if available)
+
+        Returns:
+            True if the file should be excluded
+        """
+        name = os.path.normcase(filename)
+        if name in self.literal_names:
+            return True
+        if self.name_suffixes and name.endswith(self.name_suffixes):
+            return True
+        if self.name_prefixes and name.startswith(self.name_prefixes):
+            return True
+        if self.name_pattern and self.name_pattern.match(name):
+            return True
+        if self.extensions and filename.endswith(self.extensions):
+            return True
+        check_path = os.path.normcase(path if path else filename)
+        if check_path in self.literal_paths:
+            return True
+        if self.path_prefixes and check_path.startswith(self.path_prefixes):
+            return True
+        if self.path_suffixes and check_path.endswith(self.path_suffixes):
+            return True
+        if self.path_pattern and self.path_pattern.match(check_path):
+            return True
+        return False
+
+
 def matches_exclusion(
     filename: str,
     path: str | None,
@@ -29,6 +173,9 @@ def matches_exclusion(
 ) -> bool:
     """Check if a file matches any exclusion pattern.
 
+    Compiles the patterns on every call, use ExclusionMatcher when
+    checking many files against the same patterns.
+
     Args:
         filename: The filename to check
         path: The full path (if available)
@@ -39,79 +186,98 @@ def matches_exclusion(
     Returns:
         True if the file should be excluded
     """
-    for pattern in exclude_filenames:
-        if fnmatch.fnmatch(filename, pattern):
-            return True
-    for ext in exclude_extensions:
-        ext_with_dot = ext if ext.startswith(".") else f".{ext}"
-        if filename.endswith(ext_with_dot):
-            return True
-    check_path = path if path else filename
-    for pattern in exclude_paths:
-        if fnmatch.fnmatch(check_path, pattern):
-            return True
-    return False
+    if not (exclude_filenames or exclude_extensions or exclude_paths):
+        return False
+    return ExclusionMatcher.from_patterns(
+        exclude_filenames, exclude_extensions, exclude_paths
+    ).excluded(filename, path)
 
 
-@dataclass(frozen=True)
-class ResultIdentifier:
-    """Unique identifier for a search result (file-level for AND logic)."""
+# Result identifiers are plain tuples, which are cheaper to create and
+# hash than frozen dataclasses in the per-result loops
 
-    project_id: int
-    filename: str
+# (project ID, filename) - file-level identifier for AND logic
+ResultIdentifier = tuple[int, str]
 
-    @classmethod
-    def from_result(cls, project: Project, result: SearchResult) -> "ResultIdentifier":
-        """Create identifier from project and search result."""
-        return cls(
-            project_id=project.id,
-            filename=result.filename,
-        )
+# (project ID, path) - file search result identifier
+FileResultIdentifier = tuple[int, str]
 
+# (project ID, item ID, scope) - scope search result identifier (issues, MRs, etc.)
+ScopeResultIdentifier = tuple[int, int | str, str]
 
-@dataclass(frozen=True)
-class FileResultIdentifier:
-    """Unique identifier for a file search result."""
 
-    project_id: int
-    path: str
+def _get_iid(result: dict) -> int:
+    return result.get("iid", result.get("id", 0))
 
-    @classmethod
-    def from_result(cls, project: Project, result: FileResult) -> "FileResultIdentifier":
-        """Create identifier from project and file result."""
-        return cls(
-            project_id=project.id,
-            path=result.path,
-        )
 
+def _get_sha(result: dict) -> str:
+    return result.get("id") or result.get("short_id") or ""
 
-@dataclass(frozen=True)
-class ScopeResultIdentifier:
-    """Unique identifier for a scope search result (issues, MRs, etc.)."""
 
-    project_id: int
-    item_id: int
-    item_type: str
+def _get_id(result: dict) -> int:
+    return result.get("id", 0)
 
-    @classmethod
-    def from_result(
-        cls, project: Project, result: dict, scope: str
-    ) -> "ScopeResultIdentifier":
-        """Create identifier from project and scope result."""
-        # Different scopes use different ID fields
-        if scope in ("issues", "merge_requests", "milestones"):
-            item_id = result.get("iid", result.get("id", 0))
-        elif scope == "commits":
-            item_id = hash(result.get("id", result.get("short_id", "")))
-        elif scope == "notes":
-            item_id = result.get("id", 0)
-        else:
-            item_id = result.get("id", 0)
-        return cls(
-            project_id=project.id,
-            item_id=item_id,
-            item_type=scope,
-        )
+
+def get_scope_item_id_getter(scope: str) -> Callable[[dict], int | str]:
+    """Get function extracting item IDs of a scope's search results.
+
+    Resolved once per scope, so the per-result work is a single call.
+
+    Args:
+        scope: Search scope the results come from
+
+    Returns:
+        Function returning item ID unique within the project and scope
+        (commit SHA for commits)
+    """
+    # Different scopes use different ID fields
+    if scope in ("issues", "merge_requests", "milestones"):
+        return _get_iid
+    if scope == "commits":
+        return _get_sha
+    return _get_id
+
+
+def get_scope_item_id(result: dict, scope: str) -> int | str:
+    """Get ID of a scope search result item.
+
+    Args:
+        result: Raw scope search result
+        scope: Search scope the result comes from
+
+    Returns:
+        Item ID unique within the project and scope (commit SHA for commits)
+    """
+    return get_scope_item_id_getter(scope)(result)
+
+
+# (filename, path) extractors matched against exclusion patterns
+BLOB_EXCLUSION_FIELDS = (operator.attrgetter("filename"), operator.attrgetter("filename"))
+FILE_EXCLUSION_FIELDS = (operator.attrgetter("name"), operator.attrgetter("path"))
+
+
+def filter_excluded_projects(
+    projects: list[Project],
+    exclude_projects: list[str],
+) -> list[Project]:
+    """Remove excluded projects without resolving them through the API.
+
+    Args:
+        projects: Projects to filter
+        exclude_projects: Project IDs or paths with namespace to exclude
+
+    Returns:
+        Projects not matching any excluded ID or path
+    """
+    excluded_ids = {int(p) for p in exclude_projects if p.isdigit()}
+    excluded_paths = {
+        p.strip("/").lower() for p in exclude_projects if not p.isdigit()
+    }
+    return [
+        p for p in projects
+        if p.id not in excluded_ids
+        and p.path_with_namespace.lower() not in excluded_paths
+    ]
 
 
 async def resolve_projects(
@@ -127,68 +293,50 @@ async def resolve_projects(
     Returns:
         List of Project objects to search in
     """
-    projects: list[Project] = []
-    seen_ids: set[int] = set()
-
-    # Fetch projects from groups
-    if parsed.groups:
-        groups = await client.fetch_groups(",".join(parsed.groups))
-        group_projects = await client.fetch_projects_in_groups(
+    async def fetch_group_sources(group_names: str | None) -> list[Project]:
+        groups = await client.fetch_groups(group_names)
+        return await client.fetch_projects_in_groups(
             groups,
             parsed.archived,
             parsed.recursive,
             parsed.exclude_groups if parsed.exclude_groups else None,
         )
-        for p in group_projects:
-            if p.id not in seen_ids:
-                projects.append(p)
-                seen_ids.add(p.id)
+
+    # Fetch all project sources concurrently
+    sources: list[Coroutine[Any, Any, list[Project]]] = []
+
+    # Fetch projects from groups
+    if parsed.groups:
+        sources.append(fetch_group_sources(",".join(parsed.groups)))
 
     # Fetch explicit projects
     if parsed.projects:
-        explicit_projects = await client.fetch_projects_by_ids(parsed.projects)
-        for p in explicit_projects:
-            if p.id not in seen_ids:
-                projects.append(p)
-                seen_ids.add(p.id)
+        sources.append(client.fetch_projects_by_ids(parsed.projects))
 
     # Fetch user projects
     if parsed.user:
-        user_projects = await client.fetch_user_projects(parsed.user, parsed.archived)
-        for p in user_projects:
-            if p.id not in seen_ids:
-                projects.append(p)
-                seen_ids.add(p.id)
+        sources.append(client.fetch_user_projects(parsed.user, parsed.archived))
 
     # Fetch my projects
     if parsed.my_projects:
-        my_projects = await client.fetch_my_projects(parsed.archived)
-        for p in my_projects:
-            if p.id not in seen_ids:
-                projects.append(p)
-                seen_ids.add(p.id)
+        sources.append(client.fetch_my_projects(parsed.archived))
 
     # If nothing specified, fetch all groups
-    if not parsed.groups and not parsed.projects and not parsed.user and not parsed.my_projects:
-        groups = await client.fetch_groups(None)
-        all_projects = await client.fetch_projects_in_groups(
-            groups,
-            parsed.archived,
-            parsed.recursive,
-            parsed.exclude_groups if parsed.exclude_groups else None,
-        )
-        for p in all_projects:
-            if p.id not in seen_ids:
-                projects.append(p)
-                seen_ids.add(p.id)
+    if not sources:
+        sources.append(fetch_group_sources(None))
+
+    # Projects by ID, deduplicated in source order keeping the first seen
+    merged: dict[int, Project] = {}
+    for source_projects in await gather_all(sources):
+        for p in source_projects:
+            merged.setdefault(p.id, p)
+
+    projects = list(merged.values())
 
     # Apply exclusions
     if parsed.exclude_projects:
-        # Resolve excluded project IDs
-        excluded = await client.fetch_projects_by_ids(parsed.exclude_projects)
-        excluded_ids = {p.id for p in excluded}
-        projects = [p for p in projects if p.id not in excluded_ids]
-        logger.debug("Excluded projects: %s", ", ".join(str(i) for i in excluded_ids))
+        projects = filter_excluded_projects(projects, parsed.exclude_projects)
+        logger.debug("Excluded projects: %s", ", ".join(parsed.exclude_projects))
 
     logger.debug(
         "Resolved %d projects: %s",
@@ -198,6 +346,102 @@ async def resolve_projects(
     return projects
 
 
+async def run_queries(
+    projects: list[Project],
+    expression: ExprNode,
+    all_queries: list[str],
+    search: Callable[[Project, str], Awaitable[tuple[Project, list[Any]]]],
+) -> AsyncIterator[tuple[Project, dict[str, list[Any]]]]:
+    """Run all expression queries, batched per project.
+
+    All queries of a project are issued together, so each project is
+    finished as soon as its own requests complete. If the expression
+    requires a query to match, that query is searched first and the
+    remaining queries are only searched in projects where it found
+    results.
+
+    Args:
+        projects: Projects to search in
+        expression: Expression tree for query logic
+        all_queries: All unique query strings in expression
+        search: Coroutine searching one query in one project and
+            returning (project, results) tuple
+
+    Yields:
+        (project, results by query) tuples in completion order, so
+        callers can aggregate while other projects are still searched
+    """
+    required = get_required_queries(expression)
+    anchor = required[0] if required else None
+    other_queries = [q for q in all_queries if q != anchor]
+
+    async def search_project(project: Project) -> tuple[Project, dict[str, list[Any]]]:
+        project_results: dict[str, list[Any]] = {}
+        if anchor is not None:
+            _, anchor_results = await search(project, anchor)
+            project_results[anchor] = anchor_results
+            if not anchor_results:
+                return project, project_results
+        results = await gather_all(search(project, q) for q in other_queries)
+        for query, (_, query_results) in zip(other_queries, results):
+            project_results[query] = query_results
+        return project, project_results
+
+    tasks = [asyncio.ensure_future(search_project(p)) for p in projects]
+    try:
+        for done in asyncio.as_completed(tasks):
+            yield await done
+    finally:
+        # Stop searching remaining projects after an error
+        for task in tasks:
+            task.cancel()
+
+
+def order_by_projects(
+    project_results: dict[int, tuple[Project, list[Any]]],
+    projects: list[Project],
+) -> list[tuple[Project, list[Any]]]:
+    """Order collected results by position of their project in the search.
+
+    Args:
+        project_results: Results grouped by project ID
+        projects: Searched projects in resolution order
+
+    Returns:
+        List of (project, results) tuples in project order
+    """
+    return [project_results[p.id] for p in projects if p.id in project_results]
+
+
+def evaluate_expression(
+    expression: ExprNode,
+    id_sets: dict[str, set[Any]],
+    universe: Set[Any],
+) -> Set[Any]:
+    """Evaluate expression against per-query result identifiers.
+
+    Args:
+        expression: Expression tree for query logic
+        id_sets: Identifiers found by each query, may be left empty when
+            the expression is a single query
+        universe: Identifiers found by any query, e.g. keys view of the
+            merged results; used as complement base for NOT operations
+
+    Returns:
+        Set of matching identifiers
+    """
+    # A lone query matches everything it found
+    if isinstance(expression, QueryNode):
+        return universe
+    # Nothing found, so nothing can match; NOT nodes also reject an empty universe
+    if not universe:
+        return set()
+
+    # Passed down the tree rather than stored on the NOT nodes, so the
+    # same expression can be evaluated by concurrent searches
+    return expression.evaluate(id_sets, universe)
+
+
 async def execute_blob_search(
     client: GitLabClient,
     projects: list[Project],
@@ -221,57 +465,79 @@ async def execute_blob_search(
         return []
 
     # Execute all queries in parallel
-    # Maps query -> file identifier -> list of results for that file
-    query_results: dict[str, dict[ResultIdentifier, tuple[Project, list[SearchResult]]]] = {}
-
-    async def search_query(query: str) -> tuple[str, list[tuple[Project, list[SearchResult]]]]:
-        results = await client.search_blobs_in_projects(projects, dataclass_replace(criteria, search_query=query))
-        return query, results
-
-    # Run all queries concurrently
-    query_tasks = [search_query(q) for q in all_queries]
-    query_results_list = await asyncio.gather(*query_tasks)
-
-    # Build result mappings - collect all results per file
-    for query, results in query_results_list:
-        query_results[query] = {}
-        for project, search_results in results:
-            for result in search_results:
-                rid = ResultIdentifier.from_result(project, result)
-                if rid not in query_results[query]:
-                    query_results[query][rid] = (project, [])
-                query_results[query][rid][1].append(result)
-
-    # Build ID sets for expression evaluation
-    id_sets: dict[str, set[Any]] = {
-        q: set(results.keys()) for q, results in query_results.items()
+    # File identifiers matched by each query, a lone query needs none
+    track_ids = not isinstance(expression, QueryNode)
+    id_sets: dict[str, set[Any]] = {q: set() for q in all_queries}
+    # Maps file identifier -> results for that file from all queries
+    merged_results: dict[ResultIdentifier, tuple[Project, list[SearchResult]]] = {}
+
+    # One criteria object per query, shared by all projects
+    criteria_by_query = {
+        q: SearchCriteria(
+            search_query=q,
+            filename=criteria.filename,
+            extension=criteria.extension,
+            path=criteria.path,
+        )
+        for q in all_queries
+    }
+
+    # Encoded once per query instead of once per project
+    encoded_by_query = {
+        q: build_search_query(c.search_query, c.filename, c.extension, c.path)
+        for q, c in criteria_by_query.items()
     }
 
-    # Compute universe for NOT operations (all unique result IDs)
-    universe: set[Any] = set()
-    for ids in id_sets.values():
-        universe |= ids
+    async def search_query(
+        project: Project, query: str
+    ) -> tuple[Project, list[SearchResult]]:
+        return await client.search_blobs_in_project(
+            project, criteria_by_query[query], encoded_by_query[query]
+        )
 
-    # Set universe on all NOT nodes
-    set_universe(expression, universe)
+    # Build result mappings as projects finish - collect all results per file
+    async for project, results in run_queries(projects, expression, all_queries, search_query):
+        project_id = project.id
+        for query in all_queries:
+            query_ids = id_sets[query]
+            for result in results.get(query, ()):
+                rid = (project_id, result.filename)
+                if track_ids:
+                    query_ids.add(rid)
+                # Only allocate a bucket for the first result of a file
+                entry = merged_results.get(rid)
+                if entry is None:
+                    merged_results[rid] = (project, [result])
+                else:
+                    entry[1].append(result)
 
     # Evaluate expression
-    matching_ids = expression.evaluate(id_sets)
+    matching_ids = evaluate_expression(expression, id_sets, merged_results.keys())
 
     # Collect matching results, grouped by project
     project_results: dict[int, tuple[Project, list[SearchResult]]] = {}
-
-    for query, results in query_results.items():
-        for rid, (project, result_list) in results.items():
-            if rid in matching_ids:
-                if project.id not in project_results:
-                    project_results[project.id] = (project, [])
-                # Add all results for this file, avoiding duplicates
-                for result in result_list:
-                    if result not in project_results[project.id][1]:
-                        project_results[project.id][1].append(result)
-
-    return list(project_results.values())
+    # (project ID, filename, ref, startline, data) of results already added
+    seen_results: set[tuple[int, str, str, int, str]] = set()
+
+    # Matches are a subset of the found files, equal size means all match
+    match_all = len(matching_ids) == len(merged_results)
+
+    for rid, (project, result_list) in merged_results.items():
+        if match_all or rid in matching_ids:
+            project_id = rid[0]
+            # Only allocate a bucket for the first matching file of a project
+            entry = project_results.get(project_id)
+            if entry is None:
+                entry = project_results[project_id] = (project, [])
+            collected = entry[1]
+            # Add all results for this file, dropping ones found by several queries
+            for result in result_list:
+                key = (project_id, result.filename, result.ref, result.startline, result.data)
+                if key not in seen_results:
+                    seen_results.add(key)
+                    collected.append(result)
+
+    return order_by_projects(project_results, projects)
 
 
 async def execute_scope_search(
@@ -296,44 +562,46 @@ async def execute_scope_search(
     if not all_queries:
         return []
 
-    query_results: dict[str, dict[ScopeResultIdentifier, tuple[Project, dict]]] = {}
-
-    async def search_query(query: str) -> tuple[str, list[tuple[Project, list[dict]]]]:
-        results = await client.search_scope_in_projects(projects, scope, query)
-        return query, results
+    track_ids = not isinstance(expression, QueryNode)
+    get_item_id = get_scope_item_id_getter(scope)
+    id_sets: dict[str, set[Any]] = {q: set() for q in all_queries}
+    merged_results: dict[ScopeResultIdentifier, tuple[Project, dict]] = {}
 
-    query_tasks = [search_query(q) for q in all_queries]
-    query_results_list = await asyncio.gather(*query_tasks)
+    quoted_by_query = {q: quote(q) for q in all_queries}
 
-    for query, results in query_results_list:
-        query_results[query] = {}
-        for project, scope_results in results:
-            for result in scope_results:
-                rid = ScopeResultIdentifier.from_result(project, result, scope)
-                query_results[query][rid] = (project, result)
-
-    id_sets: dict[str, set[Any]] = {
-        q: set(results.keys()) for q, results in query_results.items()
-    }
+    async def search_query(project: Project, query: str) -> tuple[Project, list[dict]]:
+        return await client.search_scope_in_project(
+            project, scope, query, quoted_by_query[query]
+        )
 
-    universe: set[Any] = set()
-    for ids in id_sets.values():
-        universe |= ids
+    async for project, results in run_queries(projects, expression, all_queries, search_query):
+        project_id = project.id
+        for query in all_queries:
+            query_ids = id_sets[query]
+            for result in results.get(query, ()):
+                rid = (project_id, get_item_id(result), scope)
+                if track_ids:
+                    query_ids.add(rid)
+                # Keep the item as returned by the first query that found it
+                merged_results.setdefault(rid, (project, result))
 
-    set_universe(expression, universe)
-    matching_ids = expression.evaluate(id_sets)
+    matching_ids = evaluate_expression(expression, id_sets, merged_results.keys())
 
+    # Each identifier is visited once, so no further deduplication is needed
     project_results: dict[int, tuple[Project, list[dict]]] = {}
 
-    for query, results in query_results.items():
-        for rid, (project, result) in results.items():
-            if rid in matching_ids:
-                if project.id not in project_results:
-                    project_results[project.id] = (project, [])
-                if result not in project_results[project.id][1]:
-                    project_results[project.id][1].append(result)
+    match_all = len(matching_ids) == len(merged_results)
+
+    for rid, (project, result) in merged_results.items():
+        if match_all or rid in matching_ids:
+            project_id = rid[0]
+            entry = project_results.get(project_id)
+            if entry is None:
+                project_results[project_id] = (project, [result])
+            else:
+                entry[1].append(result)
 
-    return list(project_results.values())
+    return order_by_projects(project_results, projects)
 
 
 async def execute_search(
@@ -348,10 +616,6 @@ async def execute_search(
         client: GitLab API client
         parsed: Parsed command with expression and options
     """
-    from .output import ColorFormatter, ResultPrinter
-
-    printer = ResultPrinter(ColorFormatter(parsed.color))
-
     # Resolve projects with exclusions
     projects = await resolve_projects(client, parsed)
 
@@ -372,58 +636,72 @@ async def execute_search(
     )
     file_patterns = FileCriteriaPatterns.from_criteria(file_criteria)
 
-    def _filter_results(results: list[tuple[Project, list[Any]]], filename_func, path_func):
+    exclusion_matcher = ExclusionMatcher.from_patterns(
+        parsed.exclude_filenames,
+        parsed.exclude_extensions,
+        parsed.exclude_paths,
+    )
+
+    def _filter_results(
+        results: list[tuple[Project, list[Any]]],
+        fields: tuple[Callable[[Any], str], Callable[[Any], str]],
+    ):
+        filename_func, path_func = fields
         filtered_results = []
         for project, result_list in results:
             filtered = [
                 r for r in result_list
-                if not matches_exclusion(
-                    filename_func(r),
-                    path_func(r),
-                    parsed.exclude_filenames,
-                    parsed.exclude_extensions,
-                    parsed.exclude_paths,
-                )
+                if not exclusion_matcher.excluded(filename_func(r), path_func(r))
             ]
             if filtered:
                 filtered_results.append((project, filtered))
         return filtered_results
 
-    # Perform search for each scope
-    for scope in parsed.scope:
+    async def run_scope(scope: str) -> list[tuple[Project, list[Any]]]:
         if scope == "blobs":
-            if expression:
-                results = await execute_blob_search(
-                    client,
-                    projects,
-                    expression,
-                    all_queries,
-                    file_criteria,
-                )
-            else:
+            if not expression:
                 # No query expression - shouldn't happen with required -q
-                results = []
+                return []
+            results = await execute_blob_search(
+                client,
+                projects,
+                expression,
+                all_queries,
+                file_criteria,
+            )
             # Apply exclusion filtering
-            if parsed.exclude_filenames or parsed.exclude_extensions or parsed.exclude_paths:
-                results = _filter_results(results, lambda x: x.filename, lambda x: x.filename)
-            printer.print_blob_results(all_queries, results, file_patterns)
-
-        elif scope == "files":
-            results = await client.search_filenames_in_projects(projects, file_criteria)
+            if exclusion_matcher.has_any():
+                results = _filter_results(results, BLOB_EXCLUSION_FIELDS)
+            return results
+
+        if scope == "files":
+            results = await client.search_filenames_in_projects(
+                projects, file_criteria, file_patterns
+            )
             # Apply exclusion filtering
-            if parsed.exclude_filenames or parsed.exclude_extensions or parsed.exclude_paths:
-                results = _filter_results(results, lambda x: x.name, lambda x: x.path)
-            printer.print_file_results(results, file_patterns)
+            if exclusion_matcher.has_any():
+                results = _filter_results(results, FILE_EXCLUSION_FIELDS)
+            return results
+
+        if not expression:
+            return []
+        return await execute_scope_search(
+            client,
+            projects,
+            scope,
+            expression,
+            all_queries,
+        )
 
-        else:
-            if expression:
-                results = await execute_scope_search(
-                    client,
-                    projects,
-                    scope,
-                    expression,
-                    all_queries,
-                )
+    # Search all scopes concurrently, requests are bounded by the client
+    scope_results = await gather_all(run_scope(scope) for scope in parsed.scope)
+
+    # Print in requested scope order
+    with ResultPrinter(ColorFormatter(parsed.color)) as printer:
+        for scope, results in zip(parsed.scope, scope_results):
+            if scope == "blobs":
+                printer.print_blob_results(all_queries, results, file_patterns)
+            elif scope == "files":
+                printer.print_file_results(results, file_patterns)
             else:
-                results = []
-            printer.print_scope_results(scope, all_queries, results)
+                printer.print_scope_results(scope, all_queries, results)
@@ -1,101 +1,204 @@
 """Expression AST for find-like query syntax."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping, Set
 from dataclasses import dataclass, field
 from typing import Any
 
 
+# Shared result of queries without any matches
+EMPTY_IDS: frozenset[Any] = frozenset()
+
+
 class ExprNode(ABC):
     """Base class for expression tree nodes."""
 
+    __slots__ = ()
+
     @abstractmethod
-    def evaluate(self, results: dict[str, set[Any]]) -> set[Any]:
+    def evaluate(
+        self, results: Mapping[str, Set[Any]], universe: Set[Any] | None = None
+    ) -> Set[Any]:
         """Evaluate this node against search results.
 
+        Any set-like values supporting &, | and - can be combined, e.g.
+        sets, frozensets or dict keys views. Operands are returned as they
+        are where possible instead of being copied.
+
         Args:
             results: Dict mapping query string to set of matching result IDs
+            universe: All possible result IDs, complement base for NOT
+                nodes; overrides universe stored on the nodes if given
 
         Returns:
             Set of result IDs that match this expression
         """
         pass
 
-    @abstractmethod
     def get_queries(self) -> list[str]:
         """Get all query strings in this expression tree.
 
         Returns:
-            List of unique query strings
+            List of query strings in expression order
+        """
+        queries: list[str] = []
+        self.collect_queries(queries)
+        return queries
+
+    @abstractmethod
+    def collect_queries(self, queries: list[str]) -> None:
+        """Append all query strings in this expression tree to a list.
+
+        Args:
+            queries: List to append the query strings to
         """
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryNode(ExprNode):
     """Leaf node representing a single search query (-q "term")."""
 
     query: str
 
-    def evaluate(self, results: dict[str, set[Any]]) -> set[Any]:
-        return results.get(self.query, set())
+    def evaluate(
+        self, results: Mapping[str, Set[Any]], universe: Set[Any] | None = None
+    ) -> Set[Any]:
+        return results.get(self.query, EMPTY_IDS)
 
-    def get_queries(self) -> list[str]:
-        return [self.query]
+    def collect_queries(self, queries: list[str]) -> None:
+        queries.append(self.query)
 
 
-@dataclass
+@dataclass(slots=True)
 class AndNode(ExprNode):
     """Binary AND node - intersection of children."""
 
     left: ExprNode
     right: ExprNode
 
-    def evaluate(self, results: dict[str, set[Any]]) -> set[Any]:
-        return self.left.evaluate(results) & self.right.evaluate(results)
-
-    def get_queries(self) -> list[str]:
-        return self.left.get_queries() + self.right.get_queries()
-
-
-@dataclass
+    def evaluate(
+        self, results: Mapping[str, Set[Any]], universe: Set[Any] | None = None
+    ) -> Set[Any]:
+        # Evaluate the whole AND chain at once, intersecting smallest first
+        operands: list[Set[Any]] = []
+        for node in _chain_operands(self, AndNode):
+            ids = node.evaluate(results, universe)
+            # Nothing can match, skip evaluating the remaining subtrees
+            if not ids:
+                return ids
+            operands.append(ids)
+        operands.sort(key=len)
+        matched = operands[0]
+        if len(operands) > 1:
+            # The first intersection is a new object, later ones update it in place
+            matched = matched & operands[1]
+            for ids in operands[2:]:
+                if not matched:
+                    break
+                matched &= ids
+        return matched
+
+    def collect_queries(self, queries: list[str]) -> None:
+        self.left.collect_queries(queries)
+        self.right.collect_queries(queries)
+
+
+@dataclass(slots=True)
 class OrNode(ExprNode):
     """Binary OR node - union of children."""
 
     left: ExprNode
     right: ExprNode
 
-    def evaluate(self, results: dict[str, set[Any]]) -> set[Any]:
-        return self.left.evaluate(results) | self.right.evaluate(results)
-
-    def get_queries(self) -> list[str]:
-        return self.left.get_queries() + self.right.get_queries()
-
-
-@dataclass
+    def evaluate(
+        self, results: Mapping[str, Set[Any]], universe: Set[Any] | None = None
+    ) -> Set[Any]:
+        # Evaluate the whole OR chain at once and union it in one pass
+        operands: list[Set[Any]] = []
+        for node in _chain_operands(self, OrNode):
+            ids = node.evaluate(results, universe)
+            # Everything already matches, skip evaluating the remaining subtrees
+            if universe is not None and ids and len(ids) == len(universe):
+                return ids
+            # Union with an empty operand is the other operand, avoid copying it
+            if ids:
+                operands.append(ids)
+        if not operands:
+            return EMPTY_IDS
+        matched = operands[0]
+        if len(operands) > 1:
+            # The first union is a new object, later ones update it in place
+            matched = matched | operands[1]
+            for ids in operands[2:]:
+                matched |= ids
+        return matched
+
+    def collect_queries(self, queries: list[str]) -> None:
+        self.left.collect_queries(queries)
+        self.right.collect_queries(queries)
+
+
+@dataclass(slots=True)
 class NotNode(ExprNode):
     """Unary NOT node - complement of child.
 
-    Requires universe set to be set before evaluation.
+    Requires universe set to be passed to evaluate or set on the node
+    before evaluation.
     """
 
     child: ExprNode
-    universe: set[Any] = field(default_factory=set)
-
-    def evaluate(self, results: dict[str, set[Any]]) -> set[Any]:
-        if not self.universe:
+    universe: Set[Any] = field(default_factory=set)
+
+    def evaluate(
+        self, results: Mapping[str, Set[Any]], universe: Set[Any] | None = None
+    ) -> Set[Any]:
+        if universe is None:
+            universe = self.universe
+        if not universe:
             raise ValueError("NOT node requires universe set for complement")
-        return self.universe - self.child.evaluate(results)
+        excluded = self.child.evaluate(results, universe)
+        # Complement of nothing is the universe itself, avoid copying it
+        if not excluded:
+            return universe
+        if len(excluded) == len(universe):
+            return EMPTY_IDS
+        return universe - excluded
+
+    def collect_queries(self, queries: list[str]) -> None:
+        self.child.collect_queries(queries)
 
-    def get_queries(self) -> list[str]:
-        return self.child.get_queries()
 
+def _chain_operands(node: AndNode | OrNode, kind: type) -> list[ExprNode]:
+    """Get operands of a chain of binary nodes of the same kind.
 
-def set_universe(node: ExprNode, universe: set[Any]) -> None:
+    Args:
+        node: Root of the chain
+        kind: Node class forming the chain, AndNode or OrNode
+
+    Returns:
+        Operands of the chain in expression order, e.g. [a, b, c] for
+        OR(OR(a, b), c)
+    """
+    operands: list[ExprNode] = []
+    stack: list[ExprNode] = [node]
+    while stack:
+        current = stack.pop()
+        if type(current) is kind:
+            stack.append(current.right)
+            stack.append(current.left)
+        else:
+            operands.append(current)
+    return operands
+
+
+def set_universe(node: ExprNode, universe: Set[Any]) -> None:
     """Recursively set universe on all NOT nodes in the tree.
 
     Args:
         node: Root of expression tree
-        universe: Universe set (all possible result IDs)
+        universe: Universe set (all possible result IDs), any set-like
+            collection such as a dict keys view
     """
     if isinstance(node, NotNode):
         node.universe = universe
@@ -105,6 +208,25 @@ def set_universe(node: ExprNode, universe: set[Any]) -> None:
         set_universe(node.right, universe)
 
 
+def get_required_queries(node: ExprNode) -> list[str]:
+    """Get queries every matching result must match.
+
+    These are the plain (non-negated) queries of the top-level AND chain.
+    A result can only match the expression if it matches all of them.
+
+    Args:
+        node: Root of expression tree
+
+    Returns:
+        List of required query strings, in expression order
+    """
+    if isinstance(node, QueryNode):
+        return [node.query]
+    if isinstance(node, AndNode):
+        return get_required_queries(node.left) + get_required_queries(node.right)
+    return []
+
+
 # Scope modifiers for project/group exclusions
 
 
@@ -129,7 +251,7 @@ class ExcludeGroup(ScopeModifier):
     groups: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedCommand:
     """Complete parsed command from CLI arguments."""
 
@@ -156,6 +278,7 @@ class ParsedCommand:
     exclude_paths: list[str] = field(default_factory=list)
     archived: str = "include"
     recursive: bool = False
+    cache: bool = False
 
     # Connection options
     api_url: str | None = None
@@ -178,12 +301,5 @@ class ParsedCommand:
         """
         if self.query_expression is None:
             return []
-        queries = self.query_expression.get_queries()
         # Remove duplicates while preserving order
-        seen = set()
-        unique = []
-        for q in queries:
-            if q not in seen:
-                seen.add(q)
-                unique.append(q)
-        return unique
+        return list(dict.fromkeys(self.query_expression.get_queries()))
@@ -1,26 +1,113 @@
 """GitLab API client with async support."""
 
 import asyncio
+import concurrent.futures
+import email.message
 import fnmatch
+import functools
+import http.client
 import json
 import logging
 import re
 import ssl
+import threading
+import time
 import urllib.error
-import urllib.request
+import urllib.parse
+from collections.abc import AsyncIterator, Callable, Coroutine, Iterable, Mapping
 from dataclasses import dataclass
 from typing import Any
 from urllib.parse import quote
 
+from .cache import ResponseCache, default_cache_dir
 from .config import Config
 
+try:
+    # Optional faster JSON parser, errors subclass json.JSONDecodeError
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Retry policy for rate limited and temporarily unavailable responses
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+MAX_RETRIES = 5
+RETRY_BASE_DELAY = 0.5
+MAX_RETRY_DELAY = 60.0
+
+# Size of reads from a response body
+READ_CHUNK_SIZE = 65536
+
+# Redirects followed per request, as urllib.request does
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+MAX_REDIRECTS = 10
+
+class ResponseTooLargeError(Exception):
+    """Response body exceeds the configured size limit."""
+
+def read_body(resp: http.client.HTTPResponse, max_bytes: int = 0) -> bytes:
+    """Read response body in fixed-size chunks.
+
+    Args:
+        resp: Response with unread body
+        max_bytes: Maximum body size, 0 for no limit
+
+    Returns:
+        Response body
+
+    Raises:
+        ResponseTooLargeError: If the body is larger than max_bytes
+    """
+    if max_bytes <= 0:
+        return resp.read()
+    if resp.length is not None and resp.length > max_bytes:
+        raise ResponseTooLargeError(f"Response body of {resp.length} bytes exceeds {max_bytes} bytes")
+
+    body = bytearray()
+    while chunk := resp.read(READ_CHUNK_SIZE):
+        body += chunk
+        if len(body) > max_bytes:
+            raise ResponseTooLargeError(f"Response body exceeds {max_bytes} bytes")
+    return bytes(body)
+
+class RateLimiter:
+    """Token bucket limiting the rate at which requests are started."""
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        """Initialize rate limiter.
+
+        Args:
+            rate: Requests per second
+            capacity: Maximum burst of requests, defaults to one second
+                worth of requests
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        # Waiters are served one at a time in arrival order
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be started."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+@dataclass(slots=True)
 class Response:
     """HTTP response wrapper."""
     status: int
-    headers: dict[str, str]
+    # Header message of the HTTP response, or a plain dict for cached ones
+    headers: Mapping[str, str]
     body: bytes
 
     def raise_for_status(self) -> None:
@@ -30,25 +117,46 @@ class Response:
                 url="", code=self.status, msg=f"HTTP {self.status}", hdrs={}, fp=None
             )
 
+    def get_header(self, name: str) -> str | None:
+        """Get header value by case-insensitive name."""
+        if isinstance(self.headers, email.message.Message):
+            # Case-insensitive lookup without copying the headers
+            return self.headers.get(name)
+        name = name.lower()
+        for key, value in self.headers.items():
+            if key.lower() == name:
+                return value
+        return None
+
     def json(self) -> Any:
         """Parse response body as JSON."""
-        return json.loads(self.body.decode("utf-8"))
+        # Both parsers accept UTF-8 bytes, skipping a decoded copy
+        return json_loads(self.body)
+
+@dataclass(slots=True)
+class InflightRequest:
+    """GET request shared by concurrent callers of the same URL."""
+    task: asyncio.Task[Response]
+    # Callers currently awaiting the task
+    waiters: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class Group:
     """GitLab group."""
     id: str
     name: str
+    full_path: str | None = None
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """GitLab project."""
     id: int
     name: str
     web_url: str
     archived: bool
+    path_with_namespace: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Search result from GitLab."""
     data: str
@@ -57,7 +165,7 @@ class SearchResult:
     startline: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchCriteria:
     """Search criteria for GitLab search."""
     search_query: str
@@ -66,24 +174,90 @@ class SearchCriteria:
     path: str | None = None
 
 
-@dataclass
+def is_wildcard(pattern: str) -> bool:
+    """Check if fnmatch pattern contains any wildcard characters."""
+    return any(c in pattern for c in "*?[")
+
+
+def get_simple_matcher(pattern: str | None) -> Callable[[str], bool] | None:
+    """Get case-insensitive string check equivalent to a simple fnmatch pattern.
+
+    Handles ASCII patterns that are literal, or literal apart from a
+    leading and/or trailing "*", which covers most filename and path
+    criteria.
+
+    Args:
+        pattern: fnmatch pattern
+
+    Returns:
+        Function checking if a string matches the pattern, or None if the
+        pattern needs the regex
+    """
+    if not pattern or not pattern.isascii():
+        return None
+    lowered = pattern.lower()
+    core = lowered.strip("*")
+    if is_wildcard(core) or len(lowered) - len(core) > 2:
+        return None
+    if lowered.startswith("*") and lowered.endswith("*") and len(lowered) > 1:
+        return lambda s: core in s.lower()
+    if lowered.startswith("*"):
+        return lambda s: s.lower().endswith(core)
+    if lowered.endswith("*"):
+        return lambda s: s.lower().startswith(core)
+    return lambda s: s.lower() == core
+
+
+@functools.lru_cache(maxsize=256)
+def compile_glob(pattern: str) -> re.Pattern[str]:
+    """Compile glob pattern to a case-insensitive regex.
+
+    Args:
+        pattern: Glob pattern (e.g., *.py)
+
+    Returns:
+        Compiled regex, shared by all criteria with the same pattern
+    """
+    return re.compile(fnmatch.translate(pattern), re.IGNORECASE)
+
+@functools.lru_cache(maxsize=256)
+def compile_extension(extension: str) -> re.Pattern[str]:
+    """Compile dotted file extension to a case-insensitive suffix regex.
+
+    Args:
+        extension: Extension including the leading dot (e.g., .py)
+
+    Returns:
+        Compiled regex, shared by all criteria with the same extension
+    """
+    return re.compile(re.escape(extension) + r'\Z', re.IGNORECASE)
+
+@dataclass(slots=True)
 class FileCriteriaPatterns:
     """Compiled regex patterns from SearchCriteria for matching and highlighting."""
     filename: re.Pattern[str] | None = None
     extension: re.Pattern[str] | None = None
     path: re.Pattern[str] | None = None
+    # String checks used for matching instead of the regexes for simple
+    # ASCII criteria, the regexes are still used for highlighting
+    filename_matcher: Callable[[str], bool] | None = None
+    path_matcher: Callable[[str], bool] | None = None
+    # Lowercased dotted extension when ASCII, matched by suffix check
+    extension_suffix: str | None = None
 
     @classmethod
     def from_criteria(cls, criteria: SearchCriteria) -> "FileCriteriaPatterns":
         """Create compiled patterns from SearchCriteria."""
         ext = criteria.extension
+        if ext and not ext.startswith("."):
+            ext = f".{ext}"
         return cls(
-            filename=re.compile(fnmatch.translate(criteria.filename), re.IGNORECASE) if criteria.filename else None,
-            extension=re.compile(
-                re.escape(ext if ext.startswith('.') else f'.{ext}') + r'\Z',
-                re.IGNORECASE
-            ) if ext else None,
-            path=re.compile(fnmatch.translate(criteria.path), re.IGNORECASE) if criteria.path else None,
+            filename=compile_glob(criteria.filename) if criteria.filename else None,
+            extension=compile_extension(ext) if ext else None,
+            path=compile_glob(criteria.path) if criteria.path else None,
+            filename_matcher=get_simple_matcher(criteria.filename),
+            path_matcher=get_simple_matcher(criteria.path),
+            extension_suffix=ext.lower() if ext and ext.isascii() else None,
         )
 
     def has_any(self) -> bool:
@@ -100,23 +274,34 @@ class FileCriteriaPatterns:
         Returns:
             True if all set patterns match
         """
-        if self.filename and not self.filename.match(name):
+        # Cheapest and usually most selective check first, path last as
+        # the longest string
+        if self.extension_suffix is not None:
+            if not name.lower().endswith(self.extension_suffix):
+                return False
+        elif self.extension and not self.extension.search(name):
             return False
-        if self.extension and not self.extension.search(name):
+        if self.filename_matcher is not None:
+            if not self.filename_matcher(name):
+                return False
+        elif self.filename and not self.filename.match(name):
             return False
-        if self.path and not self.path.match(path):
+        if self.path_matcher is not None:
+            if not self.path_matcher(path):
+                return False
+        elif self.path and not self.path.match(path):
             return False
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class FileResult:
     """File search result (filename search via repository tree)."""
     path: str
     name: str
     type: str
 
-@dataclass
+@dataclass(slots=True)
 class IssueResult:
     """Issue search result."""
     iid: int
@@ -124,7 +309,7 @@ class IssueResult:
     state: str
     web_url: str
 
-@dataclass
+@dataclass(slots=True)
 class MergeRequestResult:
     """Merge request search result."""
     iid: int
@@ -132,7 +317,7 @@ class MergeRequestResult:
     state: str
     web_url: str
 
-@dataclass
+@dataclass(slots=True)
 class MilestoneResult:
     """Milestone search result."""
     iid: int
@@ -140,14 +325,14 @@ class MilestoneResult:
     state: str
     web_url: str
 
-@dataclass
+@dataclass(slots=True)
 class WikiResult:
     """Wiki blob search result."""
     path: str
     data: str
     slug: str
 
-@dataclass
+@dataclass(slots=True)
 class CommitResult:
     """Commit search result."""
     short_id: str
@@ -155,13 +340,18 @@ class CommitResult:
     message: str
     web_url: str
 
-@dataclass
+@dataclass(slots=True)
 class NoteResult:
     """Note/comment search result."""
     body: str
     noteable_type: str
     noteable_iid: int | None
 
+
+# Next page entry of Link header, e.g. <url>; rel="next"
+LINK_NEXT_RE = re.compile(r'<([^>]*)>\s*;\s*rel="next"')
+
+
 def get_next_pagination_url(response: Response) -> str | None:
     """Extract next page URL from Link header.
 
@@ -174,20 +364,166 @@ def get_next_pagination_url(response: Response) -> str | None:
     Returns:
         Next page URL if available, None otherwise
     """
-    link_header = response.headers.get("Link")
+    link_header = response.get_header("Link")
     if not link_header:
         return None
 
-    # Parse link entries
-    for entry in link_header.split(","):
-        parts = [p.strip() for p in entry.split(";")]
-        if len(parts) >= 2:
-            url = parts[0].strip("<>")
-            rel = parts[1].strip()
-            if rel == 'rel="next"':
-                return url
+    match = LINK_NEXT_RE.search(link_header)
+    return match.group(1) if match else None
+
+def project_from_json(data: dict, archived_filter: str = "all") -> Project:
+    """Create Project from REST API project representation.
+
+    Args:
+        data: Project JSON object
+        archived_filter: Archive filter the project was listed with, used
+            to infer the archived flag missing from simple representations
+
+    Returns:
+        Project object
+    """
+    return Project(
+        id=data["id"],
+        name=data["name"],
+        web_url=data["web_url"],
+        archived=data.get("archived", archived_filter == "only"),
+        path_with_namespace=data["path_with_namespace"],
+    )
+
+def get_retry_delay(response: Response, attempt: int) -> float:
+    """Get delay before retrying a rate limited or failed request.
+
+    Args:
+        response: Response to retry
+        attempt: Number of retries already made
+
+    Returns:
+        Delay in seconds, from Retry-After header if present, otherwise
+        exponential backoff
+    """
+    retry_after = response.get_header("Retry-After")
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), MAX_RETRY_DELAY)
+    return min(RETRY_BASE_DELAY * 2 ** attempt, MAX_RETRY_DELAY)
+
+def get_page_url(url: str, page: int) -> str:
+    """Set page query parameter of a paginated URL.
+
+    Args:
+        url: Absolute URL of the first page
+        page: Page number
+
+    Returns:
+        URL of the given page
+    """
+    parts = urllib.parse.urlsplit(url)
+    params = [
+        (key, value)
+        for key, value in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+        if key != "page"
+    ]
+    params.append(("page", str(page)))
+    return urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(params)))
+
+@functools.lru_cache(maxsize=64)
+def build_search_query(
+    search_query: str,
+    filename: str | None = None,
+    extension: str | None = None,
+    path: str | None = None,
+) -> str:
+    """Build URL-encoded search query with filters.
+
+    Cached, as every project of a search issues the same few queries.
+
+    Args:
+        search_query: Search term
+        filename: Filename filter
+        extension: Extension filter
+        path: Path filter
+
+    Returns:
+        URL-encoded search query
+    """
+    parts = [search_query]
+
+    if filename:
+        parts.append(f"filename:{filename}")
+    if extension:
+        parts.append(f"extension:{extension}")
+    if path:
+        parts.append(f"path:{path}")
+
+    return quote(" ".join(parts))
+
+
+def get_graphql_url(api_url: str) -> str:
+    """Derive GraphQL endpoint URL from REST API base URL.
+
+    Args:
+        api_url: REST API base URL (e.g., https://gitlab.com/api/v4)
+
+    Returns:
+        GraphQL endpoint URL (e.g., https://gitlab.com/api/graphql)
+    """
+    base, _, _ = api_url.rstrip("/").rpartition("/")
+    return f"{base}/graphql"
+
+def parse_global_id(global_id: str) -> str:
+    """Extract numeric ID from GraphQL global ID.
 
-    return None
+    Args:
+        global_id: Global ID (e.g., gid://gitlab/Project/123)
+
+    Returns:
+        Trailing numeric part of the ID (e.g., 123)
+    """
+    return global_id.rpartition("/")[2]
+
+async def gather_all(coros: Iterable[Coroutine[Any, Any, Any]]) -> list[Any]:
+    """Run coroutines concurrently, cancelling the others on the first error.
+
+    Unlike asyncio.gather, a failing request does not leave its siblings
+    running to completion and spending API quota.
+
+    Args:
+        coros: Coroutines to run
+
+    Returns:
+        Results in the order of the coroutines
+
+    Raises:
+        Exception: First error raised by a coroutine, unwrapped from the
+            exception group of the task group
+    """
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(coro) for coro in coros]
+    except ExceptionGroup as group:
+        error: BaseException = group
+        # Nested task groups wrap errors in nested exception groups
+        while isinstance(error, BaseExceptionGroup):
+            error = error.exceptions[0]
+        raise error from None
+    return [task.result() for task in tasks]
+
+GRAPHQL_GROUP_PROJECTS_QUERY = """
+query($fullPath: ID!, $after: String) {
+  group(fullPath: $fullPath) {
+    projects(includeSubgroups: true, first: 100, after: $after) {
+      nodes { id name fullPath webUrl archived namespace { id fullPath } }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+# URL parts of responses cached only if enabled, searches and repository
+# trees are large and rarely requested again
+OPT_IN_CACHE_URL_PARTS = ("/search?", "/repository/tree?")
+
+# Query parameters of archive filters, other filters include all projects
+ARCHIVED_QUERY_PARAMS = {"only": "&archived=true", "exclude": "&archived=false"}
 
 class GitLabClient:
     """Async GitLab API client."""
@@ -202,11 +538,24 @@ class GitLabClient:
         Returns:
             Query parameter string (empty, "&archived=true", or "&archived=false")
         """
-        if archived_filter == "only":
-            return "&archived=true"
-        elif archived_filter == "exclude":
-            return "&archived=false"
-        return ""
+        return ARCHIVED_QUERY_PARAMS.get(archived_filter, "")
+
+    def _get_project_list_query_params(self, archived_filter: str) -> str:
+        """Get query parameters for project listing endpoints.
+
+        The simple project representation omits the archived flag, so it
+        is only requested when the archived filter already determines it.
+
+        Args:
+            archived_filter: Archive filter - "all"/"include", "only", or "exclude"
+
+        Returns:
+            Query parameter string starting with per_page
+        """
+        params = f"per_page={self.config.page_size}{self._get_archived_query_param(archived_filter)}"
+        if archived_filter in ARCHIVED_QUERY_PARAMS:
+            params += "&simple=true"
+        return params
 
     def __init__(self, config: Config) -> None:
         """Initialize GitLab client.
@@ -216,70 +565,400 @@ class GitLabClient:
         """
         self.config = config
         self.base_url = config.api_url.rstrip("/")
+        self.graphql_url = get_graphql_url(self.base_url)
         self.headers = {"PRIVATE-TOKEN": config.token}
         self.verify_cert = not config.ignore_cert
-        self.ssl_context: ssl.SSLContext | None = None
+        # One context for all connections, http.client would otherwise
+        # create one and load the CA certificates for each new connection
+        self.ssl_context = ssl.create_default_context()
         if not self.verify_cert:
-            self.ssl_context = ssl.create_default_context()
             self.ssl_context.check_hostname = False
             self.ssl_context.verify_mode = ssl.CERT_NONE
             logger.debug('Certificate will not be verified')
         logger.debug('Certificate verification enabled: %s', str(self.verify_cert))
         self.semaphore = asyncio.Semaphore(config.max_requests)
+        self.rate_limiter: RateLimiter | None = None
+        if config.requests_per_second > 0:
+            self.rate_limiter = RateLimiter(config.requests_per_second)
+        # Worker threads for blocking requests, one per allowed concurrent
+        # request; the default executor would cap them at min(32, CPUs + 4)
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=config.max_requests, thread_name_prefix="gitlab-search"
+        )
+        # GET requests in flight by URL, identical requests share one
+        self._inflight: dict[str, InflightRequest] = {}
+        # Idle keep-alive connections per (scheme, netloc), shared by worker threads
+        self._pool: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+        self._pool_lock = threading.Lock()
+        self.cache: ResponseCache | None = None
+        if config.cache_ttl > 0:
+            self.cache = ResponseCache(default_cache_dir(), config.token or "")
+
+    async def __aenter__(self) -> "GitLabClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close all pooled keep-alive connections and worker threads."""
+        self._executor.shutdown(wait=False)
+        with self._pool_lock:
+            pools = list(self._pool.values())
+            self._pool.clear()
+        for pool in pools:
+            for conn in pool:
+                conn.close()
+
+    async def _run_in_thread(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run blocking function in the client's worker threads.
+
+        Args:
+            func: Blocking function to run
+            *args: Arguments for func
+
+        Returns:
+            Return value of func
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def _acquire_connection(self, scheme: str, netloc: str) -> tuple[http.client.HTTPConnection, bool]:
+        """Take an idle pooled connection for host or open a new one.
+
+        Args:
+            scheme: URL scheme (http or https)
+            netloc: Host and optional port
+
+        Returns:
+            Tuple of (connection, whether it was reused from the pool)
+        """
+        with self._pool_lock:
+            pool = self._pool.get((scheme, netloc))
+            if pool:
+                return pool.pop(), True
+        return self._new_connection(scheme, netloc), False
+
+    def _new_connection(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        """Open a new connection to host.
+
+        Args:
+            scheme: URL scheme (http or https)
+            netloc: Host and optional port
+
+        Returns:
+            Unconnected HTTP(S) connection
+        """
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc, context=self.ssl_context)
+        return http.client.HTTPConnection(netloc)
+
+    def _release_connection(self, scheme: str, netloc: str, conn: http.client.HTTPConnection) -> None:
+        """Return connection to the pool, closing it if the pool is full.
+
+        Args:
+            scheme: URL scheme (http or https)
+            netloc: Host and optional port
+            conn: Connection with a fully read response
+        """
+        with self._pool_lock:
+            pool = self._pool.setdefault((scheme, netloc), [])
+            if len(pool) < self.config.max_requests:
+                pool.append(conn)
+                return
+        conn.close()
+
+    def _send_sync(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Response:
+        """Send synchronous HTTP request over a pooled keep-alive connection.
+
+        A request on a reused connection that the server has meanwhile
+        closed is retried once on a fresh connection. Up to MAX_REDIRECTS
+        redirects are followed; 301, 302 and 303 responses to requests
+        other than GET and HEAD are followed with a GET without body.
+
+        Args:
+            method: HTTP method
+            url: Full URL to request
+            body: Optional request body
+            headers: Optional headers sent in addition to the auth header
+
+        Returns:
+            Response object
+
+        Raises:
+            urllib.error.HTTPError: If the request is redirected too often
+        """
+        request_headers = {**self.headers, **headers} if headers else self.headers
+        for _ in range(MAX_REDIRECTS + 1):
+            response = self._send_once(method, url, body, request_headers)
+            location = response.get_header("Location")
+            if response.status not in REDIRECT_STATUSES or not location:
+                return response
+            if response.status in (301, 302, 303) and method not in ("GET", "HEAD"):
+                method = "GET"
+                body = None
+                request_headers = {
+                    name: value for name, value in request_headers.items()
+                    if not name.lower().startswith("content-")
+                }
+            url = urllib.parse.urljoin(url, location)
+            logger.debug("Redirected with HTTP %d to %s", response.status, url)
+
+        raise urllib.error.HTTPError(
+            url=url,
+            code=response.status,
+            msg=f"Redirected more than {MAX_REDIRECTS} times",
+            hdrs=response.headers,
+            fp=None,
+        )
+
+    def _send_once(
+        self, method: str, url: str, body: bytes | None, headers: Mapping[str, str]
+    ) -> Response:
+        """Send one HTTP request over a pooled keep-alive connection.
+
+        Args:
+            method: HTTP method
+            url: Full URL to request
+            body: Request body or None
+            headers: All request headers
+
+        Returns:
+            Response object, redirects are not followed
+        """
+        logger.debug("Requesting: %s %s", method, url)
+        parts = urllib.parse.urlsplit(url)
+        target = f"{parts.path}?{parts.query}" if parts.query else parts.path or "/"
+
+        while True:
+            conn, reused = self._acquire_connection(parts.scheme, parts.netloc)
+            try:
+                conn.request(method, target, body=body, headers=headers)
+                resp = conn.getresponse()
+                response = Response(
+                    status=resp.status,
+                    headers=resp.headers,
+                    body=read_body(resp, self.config.max_body_bytes),
+                )
+            except ResponseTooLargeError:
+                # Unread rest of the body makes the connection unusable
+                conn.close()
+                raise
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                if reused:
+                    continue
+                raise
+            break
+
+        if resp.will_close:
+            conn.close()
+        else:
+            self._release_connection(parts.scheme, parts.netloc, conn)
+        return response
 
     def _request_sync(self, url: str) -> Response:
         """Make synchronous HTTP GET request.
 
+        Listing responses are served from the response cache while fresh
+        and revalidated with their ETag afterwards. Search and repository
+        tree responses are only cached if enabled in the configuration.
+
         Args:
             url: Full URL to request
 
         Returns:
             Response object
         """
-        logger.debug("Requesting: GET %s", url)
-        request = urllib.request.Request(url, headers=self.headers)
-        with urllib.request.urlopen(request, context=self.ssl_context) as resp:
-            return Response(
-                status=resp.status,
-                headers=dict(resp.headers),
-                body=resp.read(),
-            )
+        if self.cache is None or (
+            not self.config.cache_search
+            and any(part in url for part in OPT_IN_CACHE_URL_PARTS)
+        ):
+            return self._send_sync("GET", url)
+
+        cached = self.cache.get(url)
+        if cached is not None and cached.is_fresh(self.config.cache_ttl):
+            logger.debug("Cache hit: GET %s", url)
+            return Response(status=200, headers=cached.headers, body=cached.body)
+
+        etag = cached.etag if cached is not None else None
+        response = self._send_sync(
+            "GET", url, headers={"If-None-Match": etag} if etag else None
+        )
+        if response.status == 304 and cached is not None:
+            logger.debug("Cache revalidated: GET %s", url)
+            self.cache.put(url, cached.headers, cached.body)
+            return Response(status=200, headers=cached.headers, body=cached.body)
+        if response.status == 200:
+            self.cache.put(url, response.headers, response.body)
+        return response
 
     async def _request(self, url: str) -> Response:
+        """Make async HTTP GET request, coalescing identical requests in flight.
+
+        Concurrent callers requesting the same URL, e.g. the same group
+        reached from several sources, share a single request. The request
+        is cancelled, including pending retries, once all its callers are
+        cancelled.
+
+        Args:
+            url: Full URL to request
+
+        Returns:
+            Response object
+        """
+        inflight = self._inflight.get(url)
+        if inflight is None:
+            inflight = InflightRequest(asyncio.create_task(self._request_with_retry(url)))
+            self._inflight[url] = inflight
+
+            def forget(done: asyncio.Task[Response]) -> None:
+                if self._inflight.get(url) is inflight:
+                    del self._inflight[url]
+
+            inflight.task.add_done_callback(forget)
+
+        inflight.waiters += 1
+        try:
+            # Cancelling one caller must not cancel the request for the others
+            return await asyncio.shield(inflight.task)
+        except asyncio.CancelledError:
+            if inflight.waiters == 1:
+                # Last caller gone, later callers must start a new request
+                if self._inflight.get(url) is inflight:
+                    del self._inflight[url]
+                inflight.task.cancel()
+            raise
+        finally:
+            inflight.waiters -= 1
+
+    async def _request_with_retry(self, url: str) -> Response:
         """Make async HTTP GET request with concurrent request limit.
 
+        Rate limited (429) and temporarily unavailable (502, 503, 504)
+        responses are retried with backoff. The semaphore is released
+        while waiting so that other requests are not held up. Requests
+        are started no faster than requests-per-second, if configured.
+
         Args:
             url: Full URL to request
 
         Returns:
             Response object
         """
-        async with self.semaphore:
-            return await asyncio.to_thread(self._request_sync, url)
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                await self.rate_limiter.acquire()
+            async with self.semaphore:
+                response = await self._run_in_thread(self._request_sync, url)
+            if response.status not in RETRY_STATUSES or attempt >= MAX_RETRIES:
+                return response
+            delay = get_retry_delay(response, attempt)
+            logger.debug(
+                "Got HTTP %d, retrying in %.1f s: GET %s", response.status, delay, url
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
 
-    async def _paginated_request(
-        self, url: str, is_absolute: bool = False
-    ) -> list[dict]:
-        """Make paginated HTTP GET request.
+    def _graphql_request_sync(self, query: str, variables: dict[str, Any]) -> Any:
+        """Make synchronous GraphQL POST request.
 
         Args:
-            url: URL to request (relative or absolute)
-            is_absolute: Whether URL is absolute
+            query: GraphQL query document
+            variables: Query variables
 
         Returns:
-            List of all results from all pages
+            Parsed JSON response body
+        """
+        response = self._send_sync(
+            "POST",
+            self.graphql_url,
+            body=json.dumps(
+                {"query": query, "variables": variables}, separators=(",", ":")
+            ).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def _graphql_request(self, query: str, variables: dict[str, Any]) -> Any:
+        """Make async GraphQL POST request with concurrent request limit.
+
+        Args:
+            query: GraphQL query document
+            variables: Query variables
+
+        Returns:
+            Parsed JSON response body
+        """
+        if self.rate_limiter:
+            await self.rate_limiter.acquire()
+        async with self.semaphore:
+            return await self._run_in_thread(self._graphql_request_sync, query, variables)
+
+    async def _paginated_iter(self, url: str) -> AsyncIterator[list[dict]]:
+        """Iterate over pages of paginated HTTP GET request.
+
+        When the first page reports the total number of pages, the
+        remaining pages are requested concurrently. Otherwise (e.g. for
+        listings too large for GitLab to count) the Link header is
+        followed page by page. Pages are parsed and yielded in order, so
+        callers filtering the items only keep the matching ones.
+
+        Args:
+            url: URL relative to API base URL
+
+        Yields:
+            List of results of each page
         """
-        full_url = url if is_absolute else f"{self.base_url}{url}"
+        full_url = f"{self.base_url}{url}"
         response = await self._request(full_url)
         response.raise_for_status()
+        yield response.json()
+
+        total_pages = response.get_header("X-Total-Pages")
+        if total_pages and total_pages.isdigit():
+            tasks = [
+                asyncio.ensure_future(self._request(get_page_url(full_url, page)))
+                for page in range(2, int(total_pages) + 1)
+            ]
+            try:
+                for task in tasks:
+                    page_response = await task
+                    page_response.raise_for_status()
+                    yield page_response.json()
+            finally:
+                # Consumer stopped early or a page failed
+                for task in tasks:
+                    task.cancel()
+            return
 
-        results = response.json()
         next_url = get_next_pagination_url(response)
+        while next_url:
+            response = await self._request(next_url)
+            response.raise_for_status()
+            yield response.json()
+            next_url = get_next_pagination_url(response)
+
+    async def _paginated_request(self, url: str) -> list[dict]:
+        """Make paginated HTTP GET request.
 
-        if next_url:
-            next_results = await self._paginated_request(next_url, is_absolute=True)
-            results.extend(next_results)
+        Args:
+            url: URL relative to API base URL
 
+        Returns:
+            List of all results from all pages
+        """
+        results: list[dict] = []
+        async for page in self._paginated_iter(url):
+            results.extend(page)
         return results
 
     async def fetch_groups(self, group_names: str | None = None) -> list[Group]:
@@ -295,43 +974,43 @@ class GitLabClient:
         if group_names:
             # Use provided group names directly
             groups = [
-                Group(id=name, name=name) for name in group_names.split(",")
+                Group(id=name, name=name, full_path=None if name.isdigit() else name)
+                for name in group_names.split(",")
             ]
         else:
             # Fetch all groups from API
-            data = await self._paginated_request("/groups?per_page=100")
-            groups = [Group(id=str(g["id"]), name=g["name"]) for g in data]
+            data = await self._paginated_request(f"/groups?per_page={self.config.page_size}")
+            groups = [
+                Group(id=str(g["id"]), name=g["name"], full_path=g["full_path"])
+                for g in data
+            ]
 
         logger.debug("Using groups: %s", ", ".join(g.name for g in groups))
 
         return groups
 
-    async def fetch_descendant_groups(self, group: Group) -> list[Group]:
-        """Fetch all descendant groups (subgroups at all levels) of a group.
+    async def iter_descendant_groups(self, group: Group) -> AsyncIterator[list[Group]]:
+        """Iterate over descendant groups of a group page by page.
 
-        Uses GitLab's /groups/:id/descendant_groups endpoint which returns
-        all descendants (subgroups, sub-subgroups, etc.) in one response.
+        Lets callers start working on the first descendants while the
+        remaining pages are still being fetched. Fetch errors are logged
+        and end the iteration.
 
         Args:
             group: Parent group to fetch descendants for
 
-        Returns:
-            List of all descendant Group objects
+        Yields:
+            List of descendant Group objects of each page
         """
-        url = f"/groups/{group.id}/descendant_groups?per_page=100&all_available=true"
+        url = f"/groups/{group.id}/descendant_groups?per_page={self.config.page_size}&all_available=true"
         try:
-            data = await self._paginated_request(url)
-            descendants = [Group(id=str(g["id"]), name=g["full_path"]) for g in data]
-            logger.debug(
-                "Found %d descendant groups for %s: %s",
-                len(descendants),
-                group.name,
-                ", ".join(g.name for g in descendants),
-            )
-            return descendants
+            async for page in self._paginated_iter(url):
+                yield [
+                    Group(id=str(g["id"]), name=g["full_path"], full_path=g["full_path"])
+                    for g in page
+                ]
         except Exception as e:
             logger.warning("Failed to fetch descendant groups for %s: %s", group.name, e)
-            return []
 
     async def fetch_projects_in_groups(
         self,
@@ -342,6 +1021,10 @@ class GitLabClient:
     ) -> list[Project]:
         """Fetch projects in the specified groups.
 
+        Group listing and project listing are pipelined: each group's
+        projects are requested as soon as the group is known instead of
+        after all descendant groups of all groups have been listed.
+
         Args:
             groups: List of groups to fetch projects from
             archived_filter: Archive filter - "all", "only", or "exclude"
@@ -351,63 +1034,145 @@ class GitLabClient:
         Returns:
             List of Project objects
         """
-        all_groups = list(groups)
+        exclude_set = set(exclude_groups) if exclude_groups else set()
 
-        # If recursive, fetch all descendant groups first
-        if recursive:
-            descendant_results = await asyncio.gather(
-                *[self.fetch_descendant_groups(g) for g in groups]
-            )
-            for descendants in descendant_results:
-                all_groups.extend(descendants)
-            logger.debug(
-                "Total groups after recursive expansion: %d",
-                len(all_groups),
-            )
+        def is_excluded(group: Group) -> bool:
+            return group.id in exclude_set or group.name in exclude_set
 
-        # Filter out excluded groups
-        if exclude_groups:
-            exclude_set = set(exclude_groups)
-            original_count = len(all_groups)
-            all_groups = [
-                g for g in all_groups
-                if g.id not in exclude_set and g.name not in exclude_set
-            ]
-            logger.debug(
-                "Excluded %d groups, %d remaining",
-                original_count - len(all_groups),
-                len(all_groups),
-            )
+        query_params = self._get_project_list_query_params(archived_filter)
+
+        async def fetch_group_projects(group: Group) -> list[Project]:
+            url = f"/groups/{group.id}/projects?{query_params}"
+            data = await self._paginated_request(url)
+            return [project_from_json(p, archived_filter) for p in data]
 
-        async def fetch_group_projects(group: Group) -> list[dict]:
-            url = f"/groups/{group.id}/projects?per_page=100{self._get_archived_query_param(archived_filter)}"
-            return await self._paginated_request(url)
+        async def fetch_group_tree_projects(group: Group) -> list[Project]:
+            if not recursive:
+                return [] if is_excluded(group) else await fetch_group_projects(group)
+
+            # Fetch all descendant projects with one GraphQL query and fall
+            # back to REST descendant expansion on failure
+            graphql_projects = await self.fetch_group_projects_graphql(
+                group, archived_filter, exclude_groups
+            )
+            if graphql_projects is not None:
+                return graphql_projects
+
+            # List the group's own projects while its descendants are fetched
+            async with asyncio.TaskGroup() as tg:
+                tasks = []
+                if not is_excluded(group):
+                    tasks.append(tg.create_task(fetch_group_projects(group)))
+                # Each page of descendants is fetched while the projects of
+                # the previous pages are already being listed
+                async for descendants in self.iter_descendant_groups(group):
+                    for descendant in descendants:
+                        if is_excluded(descendant):
+                            logger.debug("Excluded group %s", descendant.name)
+                        else:
+                            tasks.append(tg.create_task(fetch_group_projects(descendant)))
+            return [p for task in tasks for p in task.result()]
 
         # Fetch all group projects concurrently
-        results = await asyncio.gather(
-            *[fetch_group_projects(g) for g in all_groups]
-        )
+        results = await gather_all(fetch_group_tree_projects(g) for g in groups)
 
-        # Flatten results and deduplicate by project ID
-        seen_ids: set[int] = set()
-        all_projects: list[Project] = []
+        # Flatten results and deduplicate by project ID, keeping the first seen
+        unique_projects: dict[int, Project] = {}
         for project_list in results:
             for p in project_list:
-                if p["id"] not in seen_ids:
-                    seen_ids.add(p["id"])
-                    all_projects.append(
-                        Project(
-                            id=p["id"],
-                            name=p["name"],
-                            web_url=p["web_url"],
-                            archived=p["archived"],
-                        )
-                    )
+                unique_projects.setdefault(p.id, p)
+        all_projects = list(unique_projects.values())
 
         logger.debug("Using projects: %s", ", ".join(p.name for p in all_projects))
 
         return all_projects
 
+    async def fetch_group_projects_graphql(
+        self,
+        group: Group,
+        archived_filter: str = "all",
+        exclude_groups: list[str] | None = None,
+    ) -> list[Project] | None:
+        """Fetch projects of a group and all its subgroups via GraphQL.
+
+        A single paginated GraphQL query replaces the REST descendant group
+        listing followed by one project listing per descendant group.
+        Unlike the REST project listing, projects shared into the groups
+        from other namespaces are not included.
+
+        Args:
+            group: Parent group to fetch projects for
+            archived_filter: Archive filter - "all", "only", or "exclude"
+            exclude_groups: List of group full paths/IDs whose direct
+                projects are excluded, or the display name of the group
+                itself
+
+        Returns:
+            List of Project objects, or None if GraphQL is unavailable
+            for this group and the REST API should be used instead
+        """
+        if group.full_path is None:
+            return None
+
+        exclude_set = set(exclude_groups) if exclude_groups else set()
+        # The group itself may be excluded by its display name as listed by
+        # /groups, its projects are then matched by the namespace full path
+        if group.id in exclude_set or group.name in exclude_set:
+            exclude_set.add(group.full_path)
+        projects: list[Project] = []
+        cursor: str | None = None
+        while True:
+            try:
+                data = await self._graphql_request(
+                    GRAPHQL_GROUP_PROJECTS_QUERY,
+                    {"fullPath": group.full_path, "after": cursor},
+                )
+            except Exception as e:
+                logger.debug("GraphQL project listing failed for %s: %s", group.name, e)
+                return None
+
+            if data.get("errors") or not (data.get("data") or {}).get("group"):
+                logger.debug(
+                    "GraphQL project listing unavailable for %s: %s",
+                    group.name,
+                    data.get("errors"),
+                )
+                return None
+
+            connection = data["data"]["group"]["projects"]
+            for node in connection["nodes"]:
+                if archived_filter == "only" and not node["archived"]:
+                    continue
+                if archived_filter == "exclude" and node["archived"]:
+                    continue
+                namespace = node.get("namespace") or {}
+                if exclude_set and (
+                    namespace.get("fullPath") in exclude_set
+                    or parse_global_id(namespace.get("id", "")) in exclude_set
+                ):
+                    continue
+                projects.append(
+                    Project(
+                        id=int(parse_global_id(node["id"])),
+                        name=node["name"],
+                        web_url=node["webUrl"],
+                        path_with_namespace=node["fullPath"],
+                        archived=node["archived"],
+                    )
+                )
+
+            page_info = connection["pageInfo"]
+            if not page_info["hasNextPage"]:
+                break
+            cursor = page_info["endCursor"]
+
+        logger.debug(
+            "Found %d projects for %s via GraphQL",
+            len(projects),
+            group.name,
+        )
+        return projects
+
     def _build_search_query(self, criteria: SearchCriteria) -> str:
         """Build search query string with filters.
 
@@ -417,30 +1182,28 @@ class GitLabClient:
         Returns:
             URL-encoded search query
         """
-        parts = [criteria.search_query]
-
-        if criteria.filename:
-            parts.append(f"filename:{criteria.filename}")
-        if criteria.extension:
-            parts.append(f"extension:{criteria.extension}")
-        if criteria.path:
-            parts.append(f"path:{criteria.path}")
-
-        return quote(" ".join(parts))
+        return build_search_query(
+            criteria.search_query, criteria.filename, criteria.extension, criteria.path
+        )
 
     async def search_blobs_in_project(
-        self, project: Project, criteria: SearchCriteria
+        self,
+        project: Project,
+        criteria: SearchCriteria,
+        query: str | None = None,
     ) -> tuple[Project, list[SearchResult]]:
         """Search for blob content in a single project.
 
         Args:
             project: Project to search in
             criteria: Search criteria with optional filename/extension/path filters
+            query: URL-encoded search query built from criteria, built here if None
 
         Returns:
             Tuple of (project, search results)
         """
-        query = self._build_search_query(criteria)
+        if query is None:
+            query = self._build_search_query(criteria)
         url = f"{self.base_url}/projects/{project.id}/search?scope=blobs&search={query}"
 
         response = await self._request(url)
@@ -458,26 +1221,6 @@ class GitLabClient:
 
         return project, results
 
-    async def search_blobs_in_projects(
-        self, projects: list[Project], criteria: SearchCriteria
-    ) -> list[tuple[Project, list[SearchResult]]]:
-        """Search for blob content in multiple projects.
-
-        Args:
-            projects: List of projects to search in
-            criteria: Search criteria with optional filename/extension/path filters
-
-        Returns:
-            List of (project, search results) tuples, filtered to only
-            include projects with results
-        """
-        results = await asyncio.gather(
-            *[self.search_blobs_in_project(p, criteria) for p in projects]
-        )
-
-        # Filter to only include projects with results
-        return [(p, r) for p, r in results if r]
-
     async def fetch_user_projects(
         self, user: str, archived_filter: str = "include"
     ) -> list[Project]:
@@ -490,18 +1233,10 @@ class GitLabClient:
         Returns:
             List of Project objects
         """
-        url = f"/users/{user}/projects?per_page=100{self._get_archived_query_param(archived_filter)}"
+        url = f"/users/{user}/projects?{self._get_project_list_query_params(archived_filter)}"
         data = await self._paginated_request(url)
 
-        projects = [
-            Project(
-                id=p["id"],
-                name=p["name"],
-                web_url=p["web_url"],
-                archived=p["archived"],
-            )
-            for p in data
-        ]
+        projects = [project_from_json(p, archived_filter) for p in data]
 
         logger.debug("Using user projects: %s", ", ".join(p.name for p in projects))
         return projects
@@ -515,18 +1250,10 @@ class GitLabClient:
         Returns:
             List of Project objects
         """
-        url = f"/projects?membership=true&per_page=100{self._get_archived_query_param(archived_filter)}"
+        url = f"/projects?membership=true&{self._get_project_list_query_params(archived_filter)}"
         data = await self._paginated_request(url)
 
-        projects = [
-            Project(
-                id=p["id"],
-                name=p["name"],
-                web_url=p["web_url"],
-                archived=p["archived"],
-            )
-            for p in data
-        ]
+        projects = [project_from_json(p, archived_filter) for p in data]
 
         logger.debug("Using my projects: %s", ", ".join(p.name for p in projects))
         return projects
@@ -544,20 +1271,18 @@ class GitLabClient:
             url = f"/projects/{quote(project_id, safe='')}"
             response = await self._request(f"{self.base_url}{url}")
             response.raise_for_status()
-            p = response.json()
-            return Project(
-                id=p["id"],
-                name=p["name"],
-                web_url=p["web_url"],
-                archived=p["archived"],
-            )
+            return project_from_json(response.json())
 
-        projects = await asyncio.gather(*[fetch_project(pid) for pid in project_ids])
+        projects = await gather_all(fetch_project(pid) for pid in project_ids)
         logger.debug("Using projects: %s", ", ".join(p.name for p in projects))
-        return list(projects)
+        return projects
 
     async def search_filenames_in_project(
-        self, project: Project, criteria: SearchCriteria, ref: str = "HEAD"
+        self,
+        project: Project,
+        criteria: SearchCriteria,
+        ref: str = "HEAD",
+        patterns: FileCriteriaPatterns | None = None,
     ) -> tuple[Project, list[FileResult]]:
         """Search for files by name using repository tree API.
 
@@ -565,45 +1290,60 @@ class GitLabClient:
             project: Project to search in
             criteria: Search criteria with filename/extension/path patterns
             ref: Git ref (branch/tag) to search in
+            patterns: Patterns compiled from criteria, compiled here if None
 
         Returns:
             Tuple of (project, matching files)
         """
-        patterns = FileCriteriaPatterns.from_criteria(criteria)
+        if patterns is None:
+            patterns = FileCriteriaPatterns.from_criteria(criteria)
 
-        url = f"/projects/{project.id}/repository/tree?recursive=true&per_page=100&ref={ref}"
+        url = f"/projects/{project.id}/repository/tree?recursive=true&per_page={self.config.page_size}&ref={ref}"
+        # Filter each page as it arrives instead of holding the whole tree
+        matching: list[FileResult] = []
         try:
-            all_files = await self._paginated_request(url)
+            async for page in self._paginated_iter(url):
+                matching.extend(
+                    FileResult(path=f["path"], name=f["name"], type=f["type"])
+                    for f in page
+                    if f["type"] == "blob" and patterns.matches(f["name"], f["path"])
+                )
         except urllib.error.HTTPError:
             return project, []
 
-        matching = [
-            FileResult(path=f["path"], name=f["name"], type=f["type"])
-            for f in all_files
-            if f["type"] == "blob" and patterns.matches(f["name"], f["path"])
-        ]
-
         return project, matching
 
     async def search_filenames_in_projects(
-        self, projects: list[Project], criteria: SearchCriteria
+        self,
+        projects: list[Project],
+        criteria: SearchCriteria,
+        patterns: FileCriteriaPatterns | None = None,
     ) -> list[tuple[Project, list[FileResult]]]:
         """Search for files by name in multiple projects.
 
         Args:
             projects: List of projects to search in
             criteria: Search criteria
+            patterns: Patterns compiled from criteria, compiled once here
+                for all projects if None
 
         Returns:
             List of (project, file results) tuples
         """
-        results = await asyncio.gather(
-            *[self.search_filenames_in_project(p, criteria) for p in projects]
+        if patterns is None:
+            patterns = FileCriteriaPatterns.from_criteria(criteria)
+        results = await gather_all(
+            self.search_filenames_in_project(p, criteria, patterns=patterns)
+            for p in projects
         )
         return [(p, r) for p, r in results if r]
 
     async def search_scope_in_project(
-        self, project: Project, scope: str, search_query: str
+        self,
+        project: Project,
+        scope: str,
+        search_query: str,
+        quoted_query: str | None = None,
     ) -> tuple[Project, list[dict]]:
         """Search with a specific scope in a project.
 
@@ -611,29 +1351,14 @@ class GitLabClient:
             project: Project to search in
             scope: Search scope (issues, merge_requests, etc.)
             search_query: Search query
+            quoted_query: URL-encoded search query, encoded here if None
 
         Returns:
             Tuple of (project, raw results)
         """
-        url = f"{self.base_url}/projects/{project.id}/search?scope={scope}&search={quote(search_query)}"
+        if quoted_query is None:
+            quoted_query = quote(search_query)
+        url = f"{self.base_url}/projects/{project.id}/search?scope={scope}&search={quoted_query}"
         response = await self._request(url)
         response.raise_for_status()
         return project, response.json()
-
-    async def search_scope_in_projects(
-        self, projects: list[Project], scope: str, search_query: str
-    ) -> list[tuple[Project, list[dict]]]:
-        """Search with a specific scope in multiple projects.
-
-        Args:
-            projects: List of projects to search in
-            scope: Search scope
-            search_query: Search query
-
-        Returns:
-            List of (project, results) tuples
-        """
-        results = await asyncio.gather(
-            *[self.search_scope_in_project(p, scope, search_query) for p in projects]
-        )
-        return [(p, r) for p, r in results if r]
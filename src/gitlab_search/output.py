@@ -1,10 +1,25 @@
 """Terminal output formatting with ANSI colors."""
 
+import concurrent.futures
+import functools
+import itertools
 import re
 import sys
+from collections.abc import Callable
 
 from .gitlab import FileCriteriaPatterns, FileResult, Project, SearchResult
 
+# Results of a project formatted in parallel on free-threaded builds, in
+# chunks per worker task
+PARALLEL_FORMAT_MIN_RESULTS = 64
+FORMAT_CHUNK_SIZE = 32
+
+
+def _format_chunk(format_result: Callable[[SearchResult], str], results: list[SearchResult]) -> str:
+    """Format a slice of search results into one string."""
+    return "".join(map(format_result, results))
+
+
 class ColorFormatter:
     """Handles colored terminal output with configurable color mode."""
 
@@ -28,29 +43,19 @@ class ColorFormatter:
         else:
             self.use_colors = sys.stdout.isatty()
 
-    def red(self, text: str) -> str:
-        """Apply red color to text."""
-        if not self.use_colors:
-            return text
-        return f"{self.RED}{text}{self.RESET}"
-
-    def green(self, text: str) -> str:
-        """Apply green color to text."""
-        if not self.use_colors:
-            return text
-        return f"{self.GREEN}{text}{self.RESET}"
+        # Specialize the styling functions once instead of branching on
+        # every call; all of them return text unchanged without colors
+        self.red: Callable[[str], str] = self._styler(self.RED)
+        self.green: Callable[[str], str] = self._styler(self.GREEN)
+        self.bold: Callable[[str], str] = self._styler(self.BOLD)
+        self.underline: Callable[[str], str] = self._styler(self.UNDERLINE)
 
-    def bold(self, text: str) -> str:
-        """Apply bold formatting to text."""
+    def _styler(self, code: str) -> Callable[[str], str]:
+        """Create function applying ANSI style code to text if colors are used."""
         if not self.use_colors:
-            return text
-        return f"{self.BOLD}{text}{self.RESET}"
-
-    def underline(self, text: str) -> str:
-        """Apply underline formatting to text."""
-        if not self.use_colors:
-            return text
-        return f"{self.UNDERLINE}{text}{self.RESET}"
+            return lambda text: text
+        reset = self.RESET
+        return lambda text: f"{code}{text}{reset}"
 
 def url_to_line(project: Project, result: SearchResult) -> str:
     """Generate URL to the specific line in the file.
@@ -77,6 +82,9 @@ def indent_preview(preview: str) -> str:
     Returns:
         Indented text with each newline followed by tabs
     """
+    # Most single line previews skip the method call
+    if "\n" not in preview:
+        return preview
     return preview.replace("\n", "\n\t\t")
 
 def extract_snippet(text: str, search_queries: str | list[str], context_chars: int = 100) -> str | None:
@@ -98,21 +106,27 @@ def extract_snippet(text: str, search_queries: str | list[str], context_chars: i
     if not queries:
         return None
 
-    # Find the earliest match among all queries
+    # Find the earliest match among all queries, as (start, end) in text
     earliest_match = None
+    # Lowercasing only matches like re.IGNORECASE for ASCII text and queries
+    text_lower = text.lower() if text.isascii() else None
     for query in queries:
         if not query:
             continue
-        match = re.search(re.escape(query), text, re.IGNORECASE)
-        if match:
-            if earliest_match is None or match.start() < earliest_match.start():
-                earliest_match = match
+        if text_lower is not None and query.isascii():
+            index = text_lower.find(query.lower())
+            span = (index, index + len(query)) if index >= 0 else None
+        else:
+            match = re.search(re.escape(query), text, re.IGNORECASE)
+            span = match.span() if match else None
+        if span and (earliest_match is None or span[0] < earliest_match[0]):
+            earliest_match = span
 
     if not earliest_match:
         return None
 
-    start = max(0, earliest_match.start() - context_chars)
-    end = min(len(text), earliest_match.end() + context_chars)
+    start = max(0, earliest_match[0] - context_chars)
+    end = min(len(text), earliest_match[1] + context_chars)
 
     snippet = text[start:end]
     if start > 0:
@@ -122,18 +136,118 @@ def extract_snippet(text: str, search_queries: str | list[str], context_chars: i
 
     return snippet
 
+def highlight_literal(
+    text: str,
+    query: str,
+    prefix: str,
+    suffix: str,
+    newline: str = "\n",
+) -> str | None:
+    """Wrap case-insensitive occurrences of query in text.
+
+    Scans with str.find on lowercased copies, which is much cheaper than
+    a regex substitution for literal queries. Lowercasing only matches like
+    re.IGNORECASE for ASCII, which also folds e.g. "ſ" to "s", "K" (Kelvin
+    sign) to "k" and "ς" to "σ", so other texts and queries are refused.
+
+    Args:
+        text: Text to highlight in
+        query: Non-empty query to find
+        prefix: String inserted before each occurrence
+        suffix: String inserted after each occurrence
+        newline: Replacement of newlines in the output, used to indent
+            continuation lines in the same pass
+
+    Returns:
+        Text with occurrences wrapped, preserving their original case, or
+        None if text or query is not ASCII
+    """
+    if not (text.isascii() and query.isascii()):
+        return None
+    text_lower = text.lower()
+    query_lower = query.lower()
+    expand = newline != "\n"
+    index = text_lower.find(query_lower)
+    if index < 0:
+        return text.replace("\n", newline) if expand else text
+
+    length = len(query)
+    parts = []
+    start = 0
+    while index >= 0:
+        end = index + length
+        before = text[start:index]
+        match = text[index:end]
+        if expand:
+            before = before.replace("\n", newline)
+            match = match.replace("\n", newline)
+        parts += (before, prefix, match, suffix)
+        start = end
+        index = text_lower.find(query_lower, start)
+    rest = text[start:]
+    parts.append(rest.replace("\n", newline) if expand else rest)
+    return "".join(parts)
+
+@functools.lru_cache(maxsize=1024)
+def format_project_header(name: str, archived: bool, use_colors: bool) -> str:
+    """Format project header line, reused for projects printed in several scopes.
+
+    Args:
+        name: Project name
+        archived: Whether to append the archived indicator
+        use_colors: Whether to style the header with ANSI codes
+
+    Returns:
+        Header line including trailing newline
+    """
+    if not use_colors:
+        return f"{name} (archived):\n" if archived else f"{name}:\n"
+    fmt = ColorFormatter
+    header = f"{fmt.BOLD}{fmt.GREEN}{name}{fmt.RESET}{fmt.RESET}"
+    if archived:
+        header += f"{fmt.BOLD}{fmt.RED} (archived){fmt.RESET}{fmt.RESET}"
+    return f"{header}:\n"
+
 class ResultPrinter:
     """Prints search results with optional color formatting."""
 
-    def __init__(self, formatter: ColorFormatter) -> None:
+    def __init__(self, formatter: ColorFormatter, parallel: bool | None = None) -> None:
         """Initialize printer with a color formatter.
 
         Args:
             formatter: ColorFormatter instance for styling output
+            parallel: Whether to format results of large projects in
+                worker threads, by default only on free-threaded builds
+                running without the GIL
         """
         self.fmt = formatter
-
-    def highlight_search_query(self, search_queries: str | list[str], data: str) -> str:
+        if parallel is None:
+            is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+            parallel = is_gil_enabled is not None and not is_gil_enabled()
+        self.parallel = parallel
+        # Highlight patterns by query, the queries are the same for all results
+        self._highlight_patterns: dict[str, re.Pattern[str]] = {}
+        # Created on first use, shut down by close()
+        self._format_executor: concurrent.futures.ThreadPoolExecutor | None = None
+
+    def __enter__(self) -> "ResultPrinter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the formatting worker threads, if any were started."""
+        if self._format_executor is not None:
+            self._format_executor.shutdown()
+            self._format_executor = None
+
+    def highlight_search_query(
+        self,
+        search_queries: str | list[str],
+        data: str,
+        indent: bool = False,
+    ) -> str:
         """Highlight matched search queries in red.
 
         Uses case-insensitive matching but preserves original case
@@ -142,24 +256,41 @@ class ResultPrinter:
         Args:
             search_queries: Single query string or list of queries to highlight
             data: The text containing matches
+            indent: Also indent continuation lines like indent_preview,
+                fused into the last highlighting pass
 
         Returns:
             Text with matched search queries highlighted
         """
         if isinstance(search_queries, str):
-            queries = [search_queries]
+            queries = [search_queries] if search_queries else []
         else:
-            queries = search_queries
+            queries = [q for q in search_queries if q]
 
-        if not queries:
-            return data
+        # Highlighting is invisible without colors
+        if not self.fmt.use_colors or not queries:
+            return indent_preview(data) if indent else data
 
+        # Replacement template keeps the substitution in C, no callback per match
+        replacement = self.fmt.red(r"\1")
+        last = len(queries) - 1
         result = data
-        for query in queries:
-            if query:
-                escaped_query = re.escape(query)
-                pattern = re.compile(f"({escaped_query})", re.IGNORECASE)
-                result = pattern.sub(lambda m: self.fmt.red(m.group(1)), result)
+        for i, query in enumerate(queries):
+            newline = "\n\t\t" if indent and i == last else "\n"
+            highlighted = highlight_literal(
+                result, query, self.fmt.RED, self.fmt.RESET, newline
+            )
+            if highlighted is not None:
+                result = highlighted
+                continue
+            # Non-ASCII text or query, matched with Unicode case folding
+            pattern = self._highlight_patterns.get(query)
+            if pattern is None:
+                pattern = re.compile(f"({re.escape(query)})", re.IGNORECASE)
+                self._highlight_patterns[query] = pattern
+            result = pattern.sub(replacement, result)
+            if newline != "\n":
+                result = indent_preview(result)
         return result
 
     def highlight_file_match(
@@ -178,6 +309,9 @@ class ResultPrinter:
         Returns:
             Path with matched portions highlighted in red
         """
+        if not self.fmt.use_colors:
+            return path
+
         def _highlight_match(match: re.Match):
             return self.fmt.red(match.group(0))
 
@@ -198,12 +332,9 @@ class ResultPrinter:
 
         return result
 
-    def _print_project_header(self, project: Project) -> None:
-        """Print project header with archived indicator if needed."""
-        archived_info = ""
-        if project.archived:
-            archived_info = self.fmt.bold(self.fmt.red(" (archived)"))
-        print(f"{self.fmt.bold(self.fmt.green(project.name))}{archived_info}:")
+    def _format_project_header(self, project: Project) -> str:
+        """Format project header line with archived indicator if needed."""
+        return format_project_header(project.name, project.archived, self.fmt.use_colors)
 
     def print_blob_results(
         self,
@@ -213,33 +344,86 @@ class ResultPrinter:
     ) -> None:
         """Print blob search results with formatting.
 
+        Output of each project is written at once.
+
         Args:
             search_queries: The search query/queries used
             results: List of (project, search results) tuples
             patterns: Optional patterns for highlighting filename matches
         """
+        write = sys.stdout.write
+        highlight_names = patterns is not None and patterns.has_any()
         for project, search_results in results:
-            formatted_results = ""
-            for result in search_results:
-                # Highlight filename if patterns provided
-                filename_display = result.filename
-                if patterns and patterns.has_any():
-                    filename_display = self.highlight_file_match(
-                        patterns, result.filename, result.filename
-                    )
-                # Build URL with potentially highlighted filename
-                number_of_lines = result.data.count("\n")
-                end_line = result.startline + number_of_lines - 1
-                url = f"{project.web_url}/blob/{result.ref}/{filename_display}#L{result.startline}-{end_line}"
-
-                highlighted_data = self.highlight_search_query(
-                    search_queries, indent_preview(result.data)
-                )
-                formatted_results += (
-                    f"\n\t{self.fmt.underline(url)}\n\n\t\t{highlighted_data}"
-                )
-            self._print_project_header(project)
-            print(formatted_results)
+            format_result = functools.partial(
+                self._format_blob_result,
+                f"{project.web_url}/blob/",
+                search_queries,
+                patterns,
+                highlight_names,
+            )
+            parts = [self._format_project_header(project)]
+            executor = self._get_format_executor(len(search_results))
+            if executor is not None:
+                # ThreadPoolExecutor.map ignores chunksize, so submit slices
+                chunks = [
+                    search_results[start : start + FORMAT_CHUNK_SIZE]
+                    for start in range(0, len(search_results), FORMAT_CHUNK_SIZE)
+                ]
+                parts.extend(executor.map(_format_chunk, itertools.repeat(format_result), chunks))
+            else:
+                parts.extend(map(format_result, search_results))
+            parts.append("\n")
+            write("".join(parts))
+
+    def _format_blob_result(
+        self,
+        blob_url: str,
+        search_queries: str | list[str],
+        patterns: FileCriteriaPatterns | None,
+        highlight_names: bool,
+        result: SearchResult,
+    ) -> str:
+        """Format one blob search result with its URL and highlighted preview.
+
+        The project's blob URL prefix is built once for all its results.
+        """
+        # Highlight filename if patterns provided
+        filename_display = result.filename
+        if highlight_names:
+            filename_display = self.highlight_file_match(
+                patterns, result.filename, result.filename
+            )
+        # Build URL with potentially highlighted filename
+        data = result.data
+        number_of_lines = data.count("\n")
+        end_line = result.startline + number_of_lines - 1
+        url = f"{blob_url}{result.ref}/{filename_display}#L{result.startline}-{end_line}"
+
+        # The newline count already tells whether the preview needs indenting
+        highlighted_data = self.highlight_search_query(
+            search_queries, data, indent=number_of_lines > 0
+        )
+        return f"\n\t{self.fmt.underline(url)}\n\n\t\t{highlighted_data}"
+
+    def _get_format_executor(self, result_count: int) -> concurrent.futures.ThreadPoolExecutor | None:
+        """Get thread pool for formatting results in parallel, if worthwhile.
+
+        Formatting is pure Python, so threads only help on free-threaded
+        builds running without the GIL.
+
+        Args:
+            result_count: Number of results to format
+
+        Returns:
+            Shared thread pool, or None to format in the calling thread
+        """
+        if not self.parallel or result_count < PARALLEL_FORMAT_MIN_RESULTS:
+            return None
+        if self._format_executor is None:
+            self._format_executor = concurrent.futures.ThreadPoolExecutor(
+                thread_name_prefix="gitlab-search-format"
+            )
+        return self._format_executor
 
     def print_file_results(
         self,
@@ -248,66 +432,101 @@ class ResultPrinter:
     ) -> None:
         """Print filename search results.
 
+        Output of each project is written at once.
+
         Args:
             results: List of (project, file results) tuples
             patterns: Optional patterns for highlighting matches
         """
+        write = sys.stdout.write
+        highlight_names = patterns is not None and patterns.has_any()
         for project, file_results in results:
-            self._print_project_header(project)
+            parts = [self._format_project_header(project)]
+            file_url = f"\t{project.web_url}/-/blob/HEAD/"
             for result in file_results:
                 path_display = result.path
-                if patterns and patterns.has_any():
+                if highlight_names:
                     path_display = self.highlight_file_match(patterns, result.name, result.path)
-                url = f"{project.web_url}/-/blob/HEAD/{path_display}"
-                print(f"\t{url}")
+                parts.append(f"{file_url}{path_display}\n")
+            write("".join(parts))
 
     def print_scope_results(
         self, scope: str, search_queries: str | list[str], results: list[tuple[Project, list[dict]]]
     ) -> None:
         """Print generic scope search results.
 
+        Output of each project is written at once.
+
         Args:
             scope: The search scope (issues, merge_requests, etc.)
             search_queries: The search query/queries used
             results: List of (project, raw results) tuples
         """
+        format_result = {
+            "issues": self._format_issue_result,
+            "merge_requests": self._format_issue_result,
+            "milestones": self._format_issue_result,
+            "wiki_blobs": self._format_wiki_result,
+            "commits": self._format_commit_result,
+            "notes": self._format_note_result,
+        }.get(scope)
+
+        write = sys.stdout.write
         for project, scope_results in results:
-            self._print_project_header(project)
-            for result in scope_results:
-                if scope in ("issues", "merge_requests", "milestones"):
-                    iid = result.get("iid", "")
-                    title = result.get("title", "")
-                    state = result.get("state", "")
-                    web_url = result.get("web_url", "")
-                    description = result.get("description", "") or ""
-
-                    print(f"\n\t{self.fmt.underline(web_url)}")
-                    highlighted_title = self.highlight_search_query(search_queries, title)
-                    print(f"\t#{iid} [{state}] {highlighted_title}")
-
-                    snippet = extract_snippet(description, search_queries)
-                    if snippet:
-                        highlighted_snippet = self.highlight_search_query(search_queries, indent_preview(snippet))
-                        print(f"\t\t{highlighted_snippet}")
-                elif scope == "wiki_blobs":
-                    slug = result.get("slug", "")
-                    data = result.get("data", "")
-                    url = f"{project.web_url}/-/wikis/{slug}"
-                    highlighted = self.highlight_search_query(search_queries, indent_preview(data))
-                    print(f"\t{self.fmt.underline(url)}\n\n\t\t{highlighted}")
-                elif scope == "commits":
-                    short_id = result.get("short_id", "")
-                    title = result.get("title", "")
-                    web_url = result.get("web_url", "")
-                    print(f"\n\t{self.fmt.underline(web_url)}")
-                    print(f"\t{short_id} {title}")
-                elif scope == "notes":
-                    body = result.get("body", "")
-                    noteable_type = result.get("noteable_type", "")
-                    noteable_iid = result.get("noteable_iid", "")
-                    highlighted = self.highlight_search_query(search_queries, indent_preview(body))
-                    print(f"\n\t{noteable_type} #{noteable_iid}")
-                    print(f"\t\t{highlighted}")
+            parts = [self._format_project_header(project)]
+            if format_result is not None:
+                parts.extend(
+                    format_result(project, search_queries, result) for result in scope_results
+                )
+            write("".join(parts))
+
+    def _format_issue_result(
+        self, project: Project, search_queries: str | list[str], result: dict
+    ) -> str:
+        """Format issue, merge request or milestone with title and description snippet."""
+        iid = result.get("iid", "")
+        title = result.get("title", "")
+        state = result.get("state", "")
+        web_url = result.get("web_url", "")
+        description = result.get("description", "") or ""
+
+        highlighted_title = self.highlight_search_query(search_queries, title)
+        text = f"\n\t{self.fmt.underline(web_url)}\n\t#{iid} [{state}] {highlighted_title}\n"
+
+        snippet = extract_snippet(description, search_queries)
+        if snippet:
+            highlighted_snippet = self.highlight_search_query(search_queries, snippet, indent=True)
+            text += f"\t\t{highlighted_snippet}\n"
+        return text
+
+    def _format_wiki_result(
+        self, project: Project, search_queries: str | list[str], result: dict
+    ) -> str:
+        """Format wiki page match with its URL and highlighted content."""
+        slug = result.get("slug", "")
+        data = result.get("data", "")
+        url = f"{project.web_url}/-/wikis/{slug}"
+        highlighted = self.highlight_search_query(search_queries, data, indent=True)
+        return f"\t{self.fmt.underline(url)}\n\n\t\t{highlighted}\n"
+
+    def _format_commit_result(
+        self, project: Project, search_queries: str | list[str], result: dict
+    ) -> str:
+        """Format commit with its URL, short ID and title."""
+        short_id = result.get("short_id", "")
+        title = result.get("title", "")
+        web_url = result.get("web_url", "")
+        return f"\n\t{self.fmt.underline(web_url)}\n\t{short_id} {title}\n"
+
+    def _format_note_result(
+        self, project: Project, search_queries: str | list[str], result: dict
+    ) -> str:
+        """Format comment with the type and ID of the commented item."""
+        body = result.get("body", "")
+        noteable_type = result.get("noteable_type", "")
+        noteable_iid = result.get("noteable_iid", "")
+        highlighted = self.highlight_search_query(search_queries, body, indent=True)
+        return f"\n\t{noteable_type} #{noteable_iid}\n\t\t{highlighted}\n"
 
     def print_success(self, message: str) -> None:
         print(self.fmt.green(message))
@@ -1,7 +1,8 @@
 """Find-like expression parser for CLI arguments."""
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from enum import Enum, auto
+from enum import IntEnum, auto
 
 from .expression import (
     AndNode,
@@ -13,7 +14,7 @@ from .expression import (
 )
 
 
-class TokenType(Enum):
+class TokenType(IntEnum):
     """Token types for the expression parser."""
 
     QUERY = auto()  # -q "term"
@@ -25,7 +26,7 @@ class TokenType(Enum):
     EOF = auto()  # End of tokens
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Token:
     """Parsed token from command line."""
 
@@ -33,13 +34,17 @@ class Token:
     value: str | None = None
 
 
+# Immutable end of tokens marker shared by all parsers
+EOF_TOKEN = Token(TokenType.EOF)
+
+
 class ParseError(Exception):
     """Error during parsing of CLI arguments."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenizeResult:
     """Result of tokenizing CLI arguments."""
 
@@ -59,6 +64,7 @@ class TokenizeResult:
     exclude_paths: list[str] = field(default_factory=list)
     archived: str = "include"
     recursive: bool = False
+    cache: bool = False
     api_url: str | None = None
     ignore_cert: bool = False
     max_requests: int | None = None
@@ -70,6 +76,152 @@ class TokenizeResult:
     config_file: str | None = None
 
 
+# Handler applying an option to the result, called with the option
+# argument (None for flags) and whether the option is negated by -not/!
+OptionHandler = Callable[[TokenizeResult, str | None, bool], None]
+
+
+def _add_token(token: Token) -> OptionHandler:
+    """Create handler appending an expression token."""
+    def handler(result: TokenizeResult, value: str | None, negated: bool) -> None:
+        result.tokens.append(token)
+    return handler
+
+
+def _store(attr: str) -> OptionHandler:
+    """Create handler storing the option argument in a result attribute."""
+    def handler(result: TokenizeResult, value: str | None, negated: bool) -> None:
+        setattr(result, attr, value)
+    return handler
+
+
+def _store_true(attr: str) -> OptionHandler:
+    """Create handler setting a boolean result attribute."""
+    def handler(result: TokenizeResult, value: str | None, negated: bool) -> None:
+        setattr(result, attr, True)
+    return handler
+
+
+def _store_choice(attr: str, choices: tuple[str, ...]) -> OptionHandler:
+    """Create handler storing the option argument if it is one of choices."""
+    def handler(result: TokenizeResult, value: str | None, negated: bool) -> None:
+        if value not in choices:
+            raise ParseError(f"--{attr} must be one of: {', '.join(choices)}")
+        setattr(result, attr, value)
+    return handler
+
+
+def _extend_csv(values: list[str], value: str) -> None:
+    """Add comma separated values to a list, without splitting single values."""
+    if "," in value:
+        values.extend(value.split(","))
+    else:
+        values.append(value)
+
+
+def _extend_or_exclude(attr: str, exclude_attr: str) -> OptionHandler:
+    """Create handler adding comma separated values, or excluding them if negated."""
+    def handler(result: TokenizeResult, value: str | None, negated: bool) -> None:
+        if negated:
+            result.tokens.pop()  # Remove the NOT token
+            _extend_csv(getattr(result, exclude_attr), value)
+        else:
+            _extend_csv(getattr(result, attr), value)
+    return handler
+
+
+def _store_or_exclude(attr: str, exclude_attr: str) -> OptionHandler:
+    """Create handler storing the value, or adding it to exclusions if negated."""
+    def handler(result: TokenizeResult, value: str | None, negated: bool) -> None:
+        if negated:
+            result.tokens.pop()  # Remove the NOT token
+            getattr(result, exclude_attr).append(value)
+        else:
+            setattr(result, attr, value)
+    return handler
+
+
+def _query(result: TokenizeResult, value: str | None, negated: bool) -> None:
+    result.tokens.append(Token(TokenType.QUERY, value))
+
+
+def _scope(result: TokenizeResult, value: str | None, negated: bool) -> None:
+    if "," in value:
+        result.scope = [s.strip() for s in value.split(",")]
+    else:
+        result.scope = [value.strip()]
+
+
+def _max_requests(result: TokenizeResult, value: str | None, negated: bool) -> None:
+    try:
+        result.max_requests = int(value)
+    except ValueError:
+        raise ParseError(f"--max-requests requires an integer")
+
+
+def _raise(message: str) -> OptionHandler:
+    """Create handler for options handled by argparse."""
+    def handler(result: TokenizeResult, value: str | None, negated: bool) -> None:
+        raise ParseError(message)
+    return handler
+
+
+_NOT = _add_token(Token(TokenType.NOT))
+
+# Options by name, with the description of their required argument in
+# error messages, or None for options without an argument
+_OPTIONS: dict[str, tuple[OptionHandler, str | None]] = {
+    # Expression tokens
+    "-q": (_query, "a query argument"),
+    "-a": (_add_token(Token(TokenType.AND)), None),
+    "-o": (_add_token(Token(TokenType.OR)), None),
+    "-not": (_NOT, None),
+    "!": (_NOT, None),
+    "(": (_add_token(Token(TokenType.LPAREN)), None),
+    ")": (_add_token(Token(TokenType.RPAREN)), None),
+    # Options
+    "-g": (_extend_or_exclude("groups", "exclude_groups"), "a group argument"),
+    "-p": (_extend_or_exclude("projects", "exclude_projects"), "a project argument"),
+    "-u": (_store("user"), "a user argument"),
+    "--my-projects": (_store_true("my_projects"), None),
+    "-s": (_scope, "a scope argument"),
+    "-f": (_store_or_exclude("filename", "exclude_filenames"), "a filename argument"),
+    "-e": (_store_or_exclude("extension", "exclude_extensions"), "an extension argument"),
+    "-P": (_store_or_exclude("path", "exclude_paths"), "a path argument"),
+    "--archived": (_store_choice("archived", ("include", "only", "exclude")), "an argument"),
+    "-r": (_store_true("recursive"), None),
+    "--cache": (_store_true("cache"), None),
+    "--api-url": (_store("api_url"), "a URL argument"),
+    "--ignore-cert": (_store_true("ignore_cert"), None),
+    "--max-requests": (_max_requests, "a number argument"),
+    "--token": (_store("token"), "a token argument"),
+    "--token-file": (_store("token_file"), "a file path argument"),
+    "--color": (_store_choice("color", ("auto", "always", "never")), "an argument"),
+    "--debug": (_store_true("debug"), None),
+    "--setup": (_store_true("setup"), None),
+    "-C": (_store("config_file"), "a file path argument"),
+    # Version and help are handled by argparse, but we need to recognize them
+    "-V": (_raise("VERSION"), None),
+    "-h": (_raise("HELP"), None),
+}
+
+# Long aliases of short options
+for _short, _long in (
+    ("-g", "--groups"),
+    ("-p", "--projects"),
+    ("-u", "--user"),
+    ("-s", "--scope"),
+    ("-f", "--filename"),
+    ("-e", "--extension"),
+    ("-P", "--path"),
+    ("-r", "--recursive"),
+    ("-C", "--config"),
+    ("-V", "--version"),
+    ("-h", "--help"),
+):
+    _OPTIONS[_long] = _OPTIONS[_short]
+
+
 def tokenize_args(args: list[str]) -> TokenizeResult:
     """Tokenize command-line arguments into expression tokens and options.
 
@@ -92,220 +244,54 @@ def tokenize_args(args: list[str]) -> TokenizeResult:
     while i < len(args):
         arg = args[i]
 
-        if arg == "-q":
-            # Query predicate
-            i += 1
-            if i >= len(args):
-                raise ParseError("-q requires a query argument")
-            result.tokens.append(Token(TokenType.QUERY, args[i]))
-            pending_not = False
-
-        elif arg == "-a":
-            result.tokens.append(Token(TokenType.AND))
-            pending_not = False
-
-        elif arg == "-o":
-            result.tokens.append(Token(TokenType.OR))
-            pending_not = False
-
-        elif arg in ("-not", "!"):
-            result.tokens.append(Token(TokenType.NOT))
-            pending_not = True
-
-        elif arg == "(":
-            result.tokens.append(Token(TokenType.LPAREN))
-            pending_not = False
-
-        elif arg == ")":
-            result.tokens.append(Token(TokenType.RPAREN))
-            pending_not = False
-
-        elif arg in ("-g", "--groups"):
-            i += 1
-            if i >= len(args):
-                raise ParseError(f"{arg} requires a group argument")
-            # Check if this is an exclusion (preceded by -not)
-            if pending_not and result.tokens and result.tokens[-1].type == TokenType.NOT:
-                result.tokens.pop()  # Remove the NOT token
-                result.exclude_groups.extend(args[i].split(","))
-            else:
-                result.groups.extend(args[i].split(","))
-            pending_not = False
-
-        elif arg in ("-p", "--projects"):
-            i += 1
-            if i >= len(args):
-                raise ParseError(f"{arg} requires a project argument")
-            # Check if this is an exclusion (preceded by -not)
-            if pending_not and result.tokens and result.tokens[-1].type == TokenType.NOT:
-                result.tokens.pop()  # Remove the NOT token
-                result.exclude_projects.extend(args[i].split(","))
-            else:
-                result.projects.extend(args[i].split(","))
-            pending_not = False
-
-        elif arg in ("-u", "--user"):
-            i += 1
-            if i >= len(args):
-                raise ParseError(f"{arg} requires a user argument")
-            result.user = args[i]
-            pending_not = False
-
-        elif arg == "--my-projects":
-            result.my_projects = True
-            pending_not = False
-
-        elif arg in ("-s", "--scope"):
-            i += 1
-            if i >= len(args):
-                raise ParseError(f"{arg} requires a scope argument")
-            result.scope = [s.strip() for s in args[i].split(",")]
-            pending_not = False
-
-        elif arg in ("-f", "--filename"):
-            i += 1
-            if i >= len(args):
-                raise ParseError(f"{arg} requires a filename argument")
-            # Check if this is an exclusion (preceded by -not)
-            if pending_not and result.tokens and result.tokens[-1].type == TokenType.NOT:
-                result.tokens.pop()  # Remove the NOT token
-                result.exclude_filenames.append(args[i])
-            else:
-                result.filename = args[i]
-            pending_not = False
-
-        elif arg in ("-e", "--extension"):
-            i += 1
-            if i >= len(args):
-                raise ParseError(f"{arg} requires an extension argument")
-            # Check if this is an exclusion (preceded by -not)
-            if pending_not and result.tokens and result.tokens[-1].type == TokenType.NOT:
-                result.tokens.pop()  # Remove the NOT token
-                result.exclude_extensions.append(args[i])
-            else:
-                result.extension = args[i]
-            pending_not = False
-
-        elif arg in ("-P", "--path"):
-            i += 1
-            if i >= len(args):
-                raise ParseError(f"{arg} requires a path argument")
-            # Check if this is an exclusion (preceded by -not)
-            if pending_not and result.tokens and result.tokens[-1].type == TokenType.NOT:
-                result.tokens.pop()  # Remove the NOT token
-                result.exclude_paths.append(args[i])
-            else:
-                result.path = args[i]
-            pending_not = False
-
-        elif arg == "--archived":
-            i += 1
-            if i >= len(args):
-                raise ParseError(f"{arg} requires an argument")
-            if args[i] not in ("include", "only", "exclude"):
-                raise ParseError(
-                    f"--archived must be one of: include, only, exclude"
-                )
-            result.archived = args[i]
-            pending_not = False
-
-        elif arg in ("-r", "--recursive"):
-            result.recursive = True
-            pending_not = False
-
-        elif arg == "--api-url":
-            i += 1
-            if i >= len(args):
-                raise ParseError(f"{arg} requires a URL argument")
-            result.api_url = args[i]
-            pending_not = False
-
-        elif arg == "--ignore-cert":
-            result.ignore_cert = True
-            pending_not = False
-
-        elif arg == "--max-requests":
-            i += 1
-            if i >= len(args):
-                raise ParseError(f"{arg} requires a number argument")
-            try:
-                result.max_requests = int(args[i])
-            except ValueError:
-                raise ParseError(f"--max-requests requires an integer")
-            pending_not = False
-
-        elif arg == "--token":
-            i += 1
-            if i >= len(args):
-                raise ParseError(f"{arg} requires a token argument")
-            result.token = args[i]
-            pending_not = False
-
-        elif arg == "--token-file":
-            i += 1
-            if i >= len(args):
-                raise ParseError(f"{arg} requires a file path argument")
-            result.token_file = args[i]
-            pending_not = False
-
-        elif arg == "--color":
-            i += 1
-            if i >= len(args):
-                raise ParseError(f"{arg} requires an argument")
-            if args[i] not in ("auto", "always", "never"):
-                raise ParseError(f"--color must be one of: auto, always, never")
-            result.color = args[i]
-            pending_not = False
-
-        elif arg == "--debug":
-            result.debug = True
-            pending_not = False
-
-        elif arg == "--setup":
-            result.setup = True
-            pending_not = False
+        option = _OPTIONS.get(arg)
+        if option is None:
+            if arg.startswith("-"):
+                raise ParseError(f"Unknown option: {arg}")
+            # Unknown positional argument
+            raise ParseError(f"Unknown argument: {arg}")
 
-        elif arg in ("-C", "--config"):
+        handler, argument = option
+        value = None
+        if argument is not None:
             i += 1
             if i >= len(args):
-                raise ParseError(f"{arg} requires a file path argument")
-            result.config_file = args[i]
-            pending_not = False
+                raise ParseError(f"{arg} requires {argument}")
+            value = args[i]
 
-        elif arg in ("-V", "--version"):
-            # Version is handled by argparse, but we need to recognize it
-            raise ParseError("VERSION")
-
-        elif arg in ("-h", "--help"):
-            # Help is handled by argparse, but we need to recognize it
-            raise ParseError("HELP")
-
-        elif arg.startswith("-"):
-            raise ParseError(f"Unknown option: {arg}")
-
-        else:
-            # Unknown positional argument
-            raise ParseError(f"Unknown argument: {arg}")
+        # An option directly after -not/! is an exclusion, the NOT token is
+        # then always the last token, so handlers can pop it
+        handler(result, value, pending_not)
+        pending_not = handler is _NOT
 
         i += 1
 
-    result.tokens.append(Token(TokenType.EOF))
+    result.tokens.append(EOF_TOKEN)
     return result
 
 
+# Token types continuing a term, all but AND start an implicit AND
+TERM_CONTINUE_TYPES = frozenset(
+    {TokenType.AND, TokenType.QUERY, TokenType.NOT, TokenType.LPAREN}
+)
+
+
 class ExpressionParser:
     """Parser for find-like expression syntax.
 
     Grammar:
         expr        := term (OR term)*
         term        := factor (AND? factor)*   # AND is implicit
-        factor      := NOT? primary
-        primary     := QUERY | LPAREN expr RPAREN
+        factor      := NOT? (QUERY | LPAREN expr RPAREN)
     """
 
     def __init__(self, tokens: list[Token]):
         self.tokens = tokens
+        # Token types indexed once, checked on every parsing step
+        self.types = [t.type for t in tokens]
         self.pos = 0
+        # Leaves of repeated queries share one node
+        self.query_nodes: dict[str, QueryNode] = {}
 
     def parse(self) -> ExprNode | None:
         """Parse tokens into expression tree.
@@ -322,21 +308,27 @@ class ExpressionParser:
 
     def _has_query_tokens(self) -> bool:
         """Check if there are any QUERY tokens."""
-        return any(t.type == TokenType.QUERY for t in self.tokens)
+        return TokenType.QUERY in self.types
 
     def _current(self) -> Token:
         """Get current token."""
         if self.pos >= len(self.tokens):
-            return Token(TokenType.EOF)
+            return EOF_TOKEN
         return self.tokens[self.pos]
 
     def _previous(self) -> Token:
         """Get previous token."""
         return self.tokens[self.pos - 1]
 
+    def _current_type(self) -> TokenType:
+        """Get type of current token."""
+        if self.pos >= len(self.types):
+            return TokenType.EOF
+        return self.types[self.pos]
+
     def _check(self, token_type: TokenType) -> bool:
         """Check if current token is of given type."""
-        return self._current().type == token_type
+        return self._current_type() == token_type
 
     def _match(self, token_type: TokenType) -> bool:
         """Check and consume token if it matches."""
@@ -372,12 +364,7 @@ class ExpressionParser:
         """Parse AND expression (implicit or explicit)."""
         left = self._parse_factor()
         # Continue while we see AND, QUERY, NOT, or LPAREN (implicit AND)
-        while (
-            self._check(TokenType.AND)
-            or self._check(TokenType.QUERY)
-            or self._check(TokenType.NOT)
-            or self._check(TokenType.LPAREN)
-        ):
+        while self._current_type() in TERM_CONTINUE_TYPES:
             if self._check(TokenType.AND):
                 self._advance()  # consume explicit AND
             right = self._parse_factor()
@@ -385,28 +372,27 @@ class ExpressionParser:
         return left
 
     def _parse_factor(self) -> ExprNode:
-        """Parse NOT expression."""
-        if self._match(TokenType.NOT):
-            return NotNode(self._parse_primary())
-        return self._parse_primary()
+        """Parse NOT expression and its primary (query or grouped)."""
+        # Primary is parsed in the same call, one frame less per operand
+        negated = self._match(TokenType.NOT)
 
-    def _parse_primary(self) -> ExprNode:
-        """Parse primary expression (query or grouped)."""
         if self._match(TokenType.LPAREN):
-            expr = self._parse_expr()
+            node = self._parse_expr()
             self._expect(TokenType.RPAREN)
-            return expr
-
-        if self._match(TokenType.QUERY):
+        elif self._match(TokenType.QUERY):
             value = self._previous().value
             if value is None:
                 raise ParseError("QUERY token missing value")
-            return QueryNode(value)
+            node = self.query_nodes.get(value)
+            if node is None:
+                node = self.query_nodes[value] = QueryNode(value)
+        else:
+            raise ParseError(
+                f"Expected query or '(' at position {self.pos}, "
+                f"got {self._current().type.name}"
+            )
 
-        raise ParseError(
-            f"Expected query or '(' at position {self.pos}, "
-            f"got {self._current().type.name}"
-        )
+        return NotNode(node) if negated else node
 
 
 def parse_command(args: list[str]) -> ParsedCommand:
@@ -444,6 +430,7 @@ def parse_command(args: list[str]) -> ParsedCommand:
         exclude_paths=result.exclude_paths,
         archived=result.archived,
         recursive=result.recursive,
+        cache=result.cache,
         api_url=result.api_url,
         ignore_cert=result.ignore_cert,
         max_requests=result.max_requests,
@@ -0,0 +1,79 @@
+"""Tests for the cache module."""
+
+import os
+import stat
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from gitlab_search.cache import CACHE_MAX_AGE, ResponseCache
+
+
+class TestResponseCache(unittest.TestCase):
+    """Tests for ResponseCache."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmpdir.name) / "cache"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_miss(self):
+        """Test missing entry returns None."""
+        cache = ResponseCache(self.directory, "token")
+        self.assertIsNone(cache.get("https://gitlab.com/api/v4/groups"))
+
+    def test_put_and_get(self):
+        """Test stored response is returned with its ETag."""
+        cache = ResponseCache(self.directory, "token")
+        url = "https://gitlab.com/api/v4/groups"
+        cache.put(url, {"ETag": 'W/"abc"'}, b'[{"id": 1}]')
+
+        cached = cache.get(url)
+        self.assertIsNotNone(cached)
+        self.assertEqual(cached.body, b'[{"id": 1}]')
+        self.assertEqual(cached.etag, 'W/"abc"')
+        self.assertTrue(cached.is_fresh(300))
+        self.assertFalse(cached.is_fresh(0))
+
+    def test_namespaces_are_separate(self):
+        """Test entries of different tokens do not mix."""
+        url = "https://gitlab.com/api/v4/groups"
+        ResponseCache(self.directory, "token1").put(url, {}, b"[]")
+        self.assertIsNone(ResponseCache(self.directory, "token2").get(url))
+
+    @unittest.skipIf(os.name != "posix", "POSIX permissions")
+    def test_private_permissions(self):
+        """Test cache directory and entries are only accessible by the owner."""
+        self.directory.mkdir(mode=0o755)
+        cache = ResponseCache(self.directory, "token")
+        cache.put("https://gitlab.com/api/v4/groups", {}, b"[]")
+
+        self.assertEqual(stat.S_IMODE(self.directory.stat().st_mode), 0o700)
+        (entry,) = self.directory.iterdir()
+        self.assertEqual(stat.S_IMODE(entry.stat().st_mode), 0o600)
+
+    def test_expired_entry_deleted_on_get(self):
+        """Test entries older than max_age are deleted when read."""
+        url = "https://gitlab.com/api/v4/groups"
+        ResponseCache(self.directory, "token").put(url, {}, b"[]")
+
+        self.assertIsNone(ResponseCache(self.directory, "token", max_age=0).get(url))
+        self.assertEqual(list(self.directory.iterdir()), [])
+
+    def test_prune_on_first_put(self):
+        """Test expired entries of other URLs are deleted on the first store."""
+        ResponseCache(self.directory, "token").put("https://x/old", {}, b"[]")
+        (old,) = self.directory.iterdir()
+        expired = time.time() - CACHE_MAX_AGE - 60
+        os.utime(old, (expired, expired))
+
+        ResponseCache(self.directory, "token").put("https://x/new", {}, b"[]")
+        self.assertFalse(old.exists())
+        self.assertEqual(len(list(self.directory.iterdir())), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+"""Tests for the config module."""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from gitlab_search import config
+from gitlab_search.config import load_config
+
+
+class TestLoadConfig(unittest.TestCase):
+    """Tests for load_config function."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "config.json"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+        config._CONFIG_CACHE.pop(str(self.path), None)
+
+    def write(self, data: dict, mtime_ns: int) -> None:
+        self.path.write_text(json.dumps(data))
+        os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_reloads_changed_file(self):
+        """Test a changed file is read again and replaces its cache entry."""
+        self.write({"max-requests": 3}, 1_000_000_000)
+        self.assertEqual(load_config(str(self.path)).max_requests, 3)
+
+        self.write({"max-requests": 7}, 2_000_000_000)
+        self.assertEqual(load_config(str(self.path)).max_requests, 7)
+        self.assertEqual(config._CONFIG_CACHE[str(self.path)][0], 2_000_000_000)
+
+    def test_reuses_unchanged_file(self):
+        """Test an unchanged file is parsed only once."""
+        self.write({"max-requests": 3}, 1_000_000_000)
+        first = config._read_config_data(self.path)
+        self.assertIs(config._read_config_data(self.path), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,74 @@
 """Tests for the executor module."""
 
+import asyncio
 import unittest
 
-from gitlab_search.executor import matches_exclusion
+from gitlab_search.executor import (
+    ExclusionMatcher,
+    evaluate_expression,
+    execute_blob_search,
+    execute_scope_search,
+    filter_excluded_projects,
+    get_scope_item_id,
+    matches_exclusion,
+    resolve_projects,
+    run_queries,
+)
+from gitlab_search.expression import AndNode, NotNode, OrNode, ParsedCommand, QueryNode
+from gitlab_search.gitlab import Project, SearchCriteria, SearchResult
+
+
+def make_project(project_id: int, name: str | None = None) -> Project:
+    """Create project in group "g"."""
+    name = name or f"p{project_id}"
+    return Project(project_id, name, f"https://gitlab.test/g/{name}", False, f"g/{name}")
+
+
+def blob(filename: str, line: int) -> SearchResult:
+    """Create blob search result on main."""
+    return SearchResult(data=f"line {line}", filename=filename, ref="main", startline=line)
+
+
+class FakeClient:
+    """GitLab client stub serving fixed projects and search results.
+
+    Search results are keyed by (project ID, query); searches in projects
+    with a delay complete later than the others.
+    """
+
+    def __init__(
+        self, group_projects=(), explicit_projects=(), user_projects=(),
+        results=None, delays=None,
+    ):
+        self.group_projects = list(group_projects)
+        self.explicit_projects = list(explicit_projects)
+        self.user_projects = list(user_projects)
+        self.results = results or {}
+        self.delays = delays or {}
+        self.searched: list[tuple[int, str]] = []
+
+    async def _search(self, project: Project, query: str):
+        self.searched.append((project.id, query))
+        await asyncio.sleep(self.delays.get(project.id, 0))
+        return project, self.results.get((project.id, query), [])
+
+    async def search_blobs_in_project(self, project, criteria, query=None):
+        return await self._search(project, criteria.search_query)
+
+    async def search_scope_in_project(self, project, scope, search_query, quoted_query=None):
+        return await self._search(project, search_query)
+
+    async def fetch_groups(self, group_names):
+        return []
+
+    async def fetch_projects_in_groups(self, groups, archived, recursive, exclude_groups):
+        return self.group_projects
+
+    async def fetch_projects_by_ids(self, project_ids):
+        return self.explicit_projects
+
+    async def fetch_user_projects(self, user, archived):
+        return self.user_projects
 
 
 class TestMatchesExclusion(unittest.TestCase):
@@ -97,5 +163,280 @@ class TestMatchesExclusion(unittest.TestCase):
         )
 
 
+class TestExclusionMatcher(unittest.TestCase):
+    """Tests for ExclusionMatcher."""
+
+    def test_literal_filename(self):
+        """Test wildcard-free filename matches exactly."""
+        matcher = ExclusionMatcher.from_patterns(["Makefile"], [], [])
+        self.assertTrue(matcher.excluded("Makefile", "build/Makefile"))
+        self.assertFalse(matcher.excluded("Makefile.am", "Makefile.am"))
+
+    def test_literal_path(self):
+        """Test wildcard-free path matches exactly."""
+        matcher = ExclusionMatcher.from_patterns([], [], ["docs/index.md"])
+        self.assertTrue(matcher.excluded("index.md", "docs/index.md"))
+        self.assertFalse(matcher.excluded("index.md", "src/docs/index.md"))
+
+    def test_path_prefix(self):
+        """Test path pattern with single trailing wildcard matches by prefix."""
+        matcher = ExclusionMatcher.from_patterns([], [], ["vendor/*", "*/test/*"])
+        self.assertEqual(matcher.path_prefixes, ("vendor/",))
+        self.assertTrue(matcher.excluded("a.py", "vendor/lib/a.py"))
+        self.assertTrue(matcher.excluded("a.py", "src/test/a.py"))
+        self.assertFalse(matcher.excluded("a.py", "src/vendor/a.py"))
+
+    def test_filename_suffix_and_prefix(self):
+        """Test filename patterns with single edge wildcard skip the regex."""
+        matcher = ExclusionMatcher.from_patterns(["*.min.js", "README*"], [], [])
+        self.assertEqual(matcher.name_suffixes, (".min.js",))
+        self.assertEqual(matcher.name_prefixes, ("README",))
+        self.assertIsNone(matcher.name_pattern)
+        self.assertTrue(matcher.excluded("app.min.js", None))
+        self.assertTrue(matcher.excluded("README.md", None))
+        self.assertFalse(matcher.excluded("app.js", None))
+
+    def test_combined_wildcards(self):
+        """Test several wildcard patterns combined into one regex."""
+        matcher = ExclusionMatcher.from_patterns(["*.test.*", "[xy]?z"], [], [])
+        self.assertTrue(matcher.excluded("app.test.js", None))
+        self.assertTrue(matcher.excluded("xqz", None))
+        self.assertFalse(matcher.excluded("xqzz", None))
+        self.assertFalse(matcher.excluded("app.js", None))
+
+    def test_has_any(self):
+        """Test has_any reflects configured patterns."""
+        self.assertFalse(ExclusionMatcher.from_patterns([], [], []).has_any())
+        self.assertTrue(ExclusionMatcher.from_patterns([], ["md"], []).has_any())
+        self.assertTrue(ExclusionMatcher.from_patterns(["*.js"], [], []).has_any())
+
+
+class TestFilterExcludedProjects(unittest.TestCase):
+    """Tests for filter_excluded_projects function."""
+
+    def setUp(self):
+        self.projects = [
+            Project(1, "alpha", "https://gitlab.com/group/alpha", False, "group/alpha"),
+            Project(2, "beta", "https://gitlab.com/group/beta", False, "group/beta"),
+        ]
+
+    def test_exclude_by_id(self):
+        """Test excluding by numeric project ID."""
+        result = filter_excluded_projects(self.projects, ["1"])
+        self.assertEqual([p.id for p in result], [2])
+
+    def test_exclude_by_path(self):
+        """Test excluding by path with namespace, case-insensitively."""
+        result = filter_excluded_projects(self.projects, ["Group/Beta"])
+        self.assertEqual([p.id for p in result], [1])
+
+    def test_unknown_exclusion(self):
+        """Test exclusion not matching any project."""
+        result = filter_excluded_projects(self.projects, ["other/project", "3"])
+        self.assertEqual(len(result), 2)
+
+
+class TestResolveProjects(unittest.TestCase):
+    """Tests for resolve_projects function."""
+
+    def resolve(self, client: FakeClient, **options) -> list[Project]:
+        return asyncio.run(resolve_projects(client, ParsedCommand(**options)))
+
+    def test_sources_merged_in_order(self):
+        """Test projects of all sources are merged in source order."""
+        client = FakeClient(
+            group_projects=[make_project(1), make_project(2)],
+            explicit_projects=[make_project(3)],
+            user_projects=[make_project(2), make_project(4)],
+        )
+        projects = self.resolve(client, groups=["g"], projects=["3"], user="u")
+        self.assertEqual([p.id for p in projects], [1, 2, 3, 4])
+
+    def test_duplicate_keeps_first_project(self):
+        """Test a project found by several sources is kept as first found."""
+        first = make_project(1, "from-group")
+        client = FakeClient(group_projects=[first], explicit_projects=[make_project(1, "by-id")])
+
+        (project,) = self.resolve(client, groups=["g"], projects=["1"])
+        self.assertIs(project, first)
+
+    def test_exclusions(self):
+        """Test excluded projects are removed from the resolved ones."""
+        client = FakeClient(group_projects=[make_project(1), make_project(2)])
+        projects = self.resolve(client, exclude_projects=["g/p1"])
+        self.assertEqual([p.id for p in projects], [2])
+
+
+class TestRunQueries(unittest.TestCase):
+    """Tests for run_queries function."""
+
+    def run_all(self, client: FakeClient, projects: list[Project], expression):
+        async def collect():
+            return [
+                (project.id, results)
+                async for project, results in run_queries(
+                    projects, expression, expression.get_queries(), client._search
+                )
+            ]
+        return asyncio.run(collect())
+
+    def test_anchor_query_short_circuits(self):
+        """Test other queries are skipped in projects without required matches."""
+        client = FakeClient(results={(1, "a"): ["x"], (1, "b"): ["y"]})
+        results = self.run_all(
+            client, [make_project(1), make_project(2)], AndNode(QueryNode("a"), QueryNode("b"))
+        )
+
+        self.assertEqual(sorted(client.searched), [(1, "a"), (1, "b"), (2, "a")])
+        self.assertEqual(dict(results), {1: {"a": ["x"], "b": ["y"]}, 2: {"a": []}})
+
+    def test_no_anchor_for_or(self):
+        """Test all queries are searched when no query is required."""
+        client = FakeClient()
+        self.run_all(client, [make_project(1)], OrNode(QueryNode("a"), QueryNode("b")))
+        self.assertEqual(sorted(client.searched), [(1, "a"), (1, "b")])
+
+    def test_completion_order(self):
+        """Test projects are yielded as their searches complete."""
+        client = FakeClient(delays={1: 0.02})
+        results = self.run_all(client, [make_project(1), make_project(2)], QueryNode("a"))
+        self.assertEqual([project_id for project_id, _ in results], [2, 1])
+
+
+class TestExecuteBlobSearch(unittest.TestCase):
+    """Tests for execute_blob_search function."""
+
+    projects = [make_project(1), make_project(2)]
+
+    def search(self, client: FakeClient, expression) -> list[tuple[int, list[tuple[str, int]]]]:
+        results = asyncio.run(execute_blob_search(
+            client, self.projects, expression, expression.get_queries(),
+            SearchCriteria(search_query=""),
+        ))
+        return [
+            (project.id, [(r.filename, r.startline) for r in result_list])
+            for project, result_list in results
+        ]
+
+    def test_projects_in_resolution_order(self):
+        """Test projects are returned in resolution order, not completion order."""
+        client = FakeClient(
+            results={(1, "a"): [blob("x.py", 1)], (2, "a"): [blob("y.py", 1)]},
+            delays={1: 0.02},
+        )
+        self.assertEqual(
+            self.search(client, QueryNode("a")),
+            [(1, [("x.py", 1)]), (2, [("y.py", 1)])],
+        )
+
+    def test_results_grouped_per_file(self):
+        """Test results of later queries follow earlier results of the same file."""
+        client = FakeClient(results={
+            (1, "a"): [blob("x.py", 1), blob("y.py", 2)],
+            (1, "b"): [blob("x.py", 5), blob("x.py", 1)],
+        })
+        self.assertEqual(
+            self.search(client, OrNode(QueryNode("a"), QueryNode("b"))),
+            [(1, [("x.py", 1), ("x.py", 5), ("y.py", 2)])],
+        )
+
+    def test_and_matches_files_found_by_all(self):
+        """Test AND keeps only files found by every query."""
+        client = FakeClient(results={
+            (1, "a"): [blob("x.py", 1), blob("y.py", 1)],
+            (1, "b"): [blob("y.py", 3)],
+            (2, "b"): [blob("z.py", 1)],
+        })
+        self.assertEqual(
+            self.search(client, AndNode(QueryNode("a"), QueryNode("b"))),
+            [(1, [("y.py", 1), ("y.py", 3)])],
+        )
+
+    def test_not_excludes_files(self):
+        """Test NOT removes files found by the negated query."""
+        client = FakeClient(results={
+            (1, "a"): [blob("x.py", 1), blob("y.py", 1)],
+            (1, "b"): [blob("y.py", 3)],
+            (2, "a"): [blob("z.py", 1)],
+        })
+        self.assertEqual(
+            self.search(client, AndNode(QueryNode("a"), NotNode(QueryNode("b")))),
+            [(1, [("x.py", 1)]), (2, [("z.py", 1)])],
+        )
+
+
+class TestExecuteScopeSearch(unittest.TestCase):
+    """Tests for execute_scope_search function."""
+
+    projects = [make_project(1), make_project(2)]
+
+    def search(self, client: FakeClient, expression) -> list[tuple[int, list[int]]]:
+        results = asyncio.run(execute_scope_search(
+            client, self.projects, "issues", expression, expression.get_queries()
+        ))
+        return [(project.id, [item["iid"] for item in items]) for project, items in results]
+
+    def test_or_merges_items_in_project_order(self):
+        """Test OR lists each item once, projects in resolution order."""
+        client = FakeClient(
+            results={
+                (1, "a"): [{"iid": 1}, {"iid": 2}],
+                (1, "b"): [{"iid": 2}, {"iid": 3}],
+                (2, "b"): [{"iid": 7}],
+            },
+            delays={1: 0.02},
+        )
+        self.assertEqual(
+            self.search(client, OrNode(QueryNode("a"), QueryNode("b"))),
+            [(1, [1, 2, 3]), (2, [7])],
+        )
+
+    def test_and_not(self):
+        """Test AND with NOT across queries of the same items."""
+        client = FakeClient(results={
+            (1, "a"): [{"iid": 1}, {"iid": 2}],
+            (1, "b"): [{"iid": 2}],
+            (2, "a"): [{"iid": 5}],
+            (2, "b"): [{"iid": 5}],
+        })
+        self.assertEqual(
+            self.search(client, AndNode(QueryNode("a"), NotNode(QueryNode("b")))),
+            [(1, [1])],
+        )
+
+
+class TestGetScopeItemId(unittest.TestCase):
+    """Tests for get_scope_item_id function."""
+
+    def test_iid_scopes(self):
+        """Test project-scoped items use iid."""
+        self.assertEqual(get_scope_item_id({"id": 100, "iid": 3}, "issues"), 3)
+
+    def test_commit_uses_sha(self):
+        """Test commits are identified by their SHA string."""
+        self.assertEqual(get_scope_item_id({"id": "abc123", "short_id": "abc"}, "commits"), "abc123")
+        self.assertEqual(get_scope_item_id({"short_id": "abc"}, "commits"), "abc")
+
+
+
+class TestEvaluateExpression(unittest.TestCase):
+    """Tests for evaluate_expression function."""
+
+    def test_single_query_matches_universe(self):
+        """Test lone query matches all found identifiers without id sets."""
+        universe = {(1, "a"): None, (2, "b"): None}.keys()
+        self.assertIs(evaluate_expression(QueryNode("x"), {}, universe), universe)
+
+    def test_not_uses_universe(self):
+        """Test NOT nodes get the universe assigned before evaluation."""
+        expression = AndNode(QueryNode("a"), NotNode(QueryNode("b")))
+        id_sets = {"a": {1, 2}, "b": {2, 3}}
+        self.assertEqual(evaluate_expression(expression, id_sets, {1, 2, 3}), {1})
+
+    def test_empty_universe(self):
+        """Test expression with NOT matches nothing when no query found anything."""
+        expression = AndNode(QueryNode("a"), NotNode(QueryNode("b")))
+        self.assertEqual(evaluate_expression(expression, {"a": set(), "b": set()}, set()), set())
+
 if __name__ == "__main__":
     unittest.main()
@@ -7,6 +7,7 @@ from gitlab_search.expression import (
     NotNode,
     OrNode,
     QueryNode,
+    get_required_queries,
     set_universe,
 )
 
@@ -56,6 +57,22 @@ class TestAndNode(unittest.TestCase):
 
         self.assertEqual(node.evaluate(results), set())
 
+    def test_evaluate_skips_right_when_left_empty(self):
+        """Test AND does not evaluate right subtree when left matches nothing."""
+        # NOT without universe would raise if evaluated
+        node = AndNode(QueryNode("a"), NotNode(QueryNode("b")))
+        results = {"a": set(), "b": {1}}
+
+        self.assertEqual(node.evaluate(results), set())
+
+    def test_evaluate_chain(self):
+        """Test AND chains are intersected at once without changing operands."""
+        a, b, c = {1, 2, 3, 4}, {2, 3, 4}, {3}
+        node = AndNode(AndNode(QueryNode("a"), QueryNode("b")), QueryNode("c"))
+
+        self.assertEqual(node.evaluate({"a": a, "b": b, "c": c}), {3})
+        self.assertEqual((a, b, c), ({1, 2, 3, 4}, {2, 3, 4}, {3}))
+
     def test_get_queries(self):
         """Test getting queries from AND node."""
         node = AndNode(QueryNode("a"), QueryNode("b"))
@@ -66,6 +83,23 @@ class TestAndNode(unittest.TestCase):
 class TestOrNode(unittest.TestCase):
     """Tests for OrNode."""
 
+    def test_evaluate_skips_right_when_left_is_universe(self):
+        """Test OR does not evaluate right subtree when left matches everything."""
+        class CountingQueryNode(QueryNode):
+            evaluations = 0
+
+            def evaluate(self, results, universe=None):
+                CountingQueryNode.evaluations += 1
+                return super().evaluate(results, universe)
+
+        node = OrNode(QueryNode("a"), CountingQueryNode("b"))
+        results = {"a": {1, 2}, "b": {1}}
+
+        self.assertEqual(node.evaluate(results, {1, 2}), {1, 2})
+        self.assertEqual(CountingQueryNode.evaluations, 0)
+        self.assertEqual(node.evaluate(results, {1, 2, 3}), {1, 2})
+        self.assertEqual(CountingQueryNode.evaluations, 1)
+
     def test_evaluate_union(self):
         """Test OR evaluates to union."""
         left = QueryNode("a")
@@ -84,6 +118,16 @@ class TestOrNode(unittest.TestCase):
 
         self.assertEqual(node.evaluate(results), {1, 2, 3})
 
+    def test_evaluate_long_chain(self):
+        """Test long OR chains are evaluated without recursing per operand."""
+        node = QueryNode("q0")
+        for i in range(1, 5000):
+            node = OrNode(node, QueryNode(f"q{i}"))
+        results = {f"q{i}": {i} for i in range(5000)}
+
+        self.assertEqual(node.evaluate(results), set(range(5000)))
+        self.assertEqual(results["q0"], {0})
+
     def test_get_queries(self):
         """Test getting queries from OR node."""
         node = OrNode(QueryNode("a"), QueryNode("b"))
@@ -118,6 +162,27 @@ class TestNotNode(unittest.TestCase):
 
         self.assertEqual(node.evaluate(results), {1, 2, 3})
 
+    def test_evaluate_full_complement_returns_universe(self):
+        """Test NOT of an empty child returns the universe without copying it."""
+        universe = {1: "x", 2: "y"}.keys()
+        node = NotNode(QueryNode("a"))
+
+        self.assertIs(node.evaluate({"a": set()}, universe), universe)
+
+    def test_evaluate_keys_view_universe(self):
+        """Test NOT accepts a dict keys view as universe."""
+        node = NotNode(QueryNode("a"), universe={1: "x", 2: "y", 3: "z"}.keys())
+        results = {"a": {1}}
+
+        self.assertEqual(node.evaluate(results), {2, 3})
+
+    def test_evaluate_universe_argument(self):
+        """Test universe passed to evaluate overrides the node's universe."""
+        node = AndNode(QueryNode("b"), NotNode(QueryNode("a"), universe={1}))
+        results = {"a": {1}, "b": {2, 3}}
+
+        self.assertEqual(node.evaluate(results, {1, 2, 3}), {2, 3})
+
     def test_evaluate_without_universe_raises(self):
         """Test NOT without universe raises error."""
         child = QueryNode("a")
@@ -177,6 +242,32 @@ class TestSetUniverse(unittest.TestCase):
         # No error, just does nothing
 
 
+class TestGetRequiredQueries(unittest.TestCase):
+    """Tests for get_required_queries function."""
+
+    def test_single_query(self):
+        """Test single query is required."""
+        self.assertEqual(get_required_queries(QueryNode("a")), ["a"])
+
+    def test_and_chain(self):
+        """Test all queries of AND chain are required."""
+        node = AndNode(AndNode(QueryNode("a"), QueryNode("b")), QueryNode("c"))
+        self.assertEqual(get_required_queries(node), ["a", "b", "c"])
+
+    def test_and_with_not_and_or(self):
+        """Test negated and OR factors are not required."""
+        node = AndNode(
+            AndNode(NotNode(QueryNode("a")), OrNode(QueryNode("b"), QueryNode("c"))),
+            QueryNode("d"),
+        )
+        self.assertEqual(get_required_queries(node), ["d"])
+
+    def test_or_root(self):
+        """Test OR root has no required queries."""
+        node = OrNode(QueryNode("a"), QueryNode("b"))
+        self.assertEqual(get_required_queries(node), [])
+
+
 class TestComplexExpressions(unittest.TestCase):
     """Tests for complex expression evaluation."""
 
@@ -256,6 +347,18 @@ class TestComplexExpressions(unittest.TestCase):
         # ((a AND b) OR (c AND d)) AND e = {2, 6}
         self.assertEqual(final.evaluate(results), {2, 6})
 
+    def test_frozenset_results(self):
+        """Test expressions combine immutable set-like results."""
+        # (a OR b) AND NOT c
+        node = AndNode(
+            OrNode(QueryNode("a"), QueryNode("b")), NotNode(QueryNode("c"))
+        )
+        results = {"a": frozenset({1, 2}), "b": frozenset({3}), "c": frozenset({2})}
+
+        evaluated = node.evaluate(results, frozenset({1, 2, 3, 4}))
+        self.assertEqual(evaluated, {1, 3})
+        self.assertIsInstance(evaluated, frozenset)
+
 
 if __name__ == "__main__":
     unittest.main()
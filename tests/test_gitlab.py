@@ -0,0 +1,562 @@
+"""Tests for the gitlab module."""
+
+import asyncio
+import http.client
+import io
+import json
+import tempfile
+import time
+import unittest
+import urllib.error
+from pathlib import Path
+
+from gitlab_search.cache import ResponseCache
+from gitlab_search.config import Config
+from gitlab_search.gitlab import (
+    MAX_REDIRECTS,
+    MAX_RETRIES,
+    RETRY_BASE_DELAY,
+    FileCriteriaPatterns,
+    GitLabClient,
+    Group,
+    RateLimiter,
+    Response,
+    ResponseTooLargeError,
+    SearchCriteria,
+    get_next_pagination_url,
+    get_retry_delay,
+    gather_all,
+    get_simple_matcher,
+    read_body,
+)
+
+
+class TestGetSimpleMatcher(unittest.TestCase):
+    """Tests for get_simple_matcher function."""
+
+    def test_literal(self):
+        """Test literal pattern compares case-insensitively."""
+        matcher = get_simple_matcher("Makefile")
+        self.assertTrue(matcher("makefile"))
+        self.assertFalse(matcher("Makefile.am"))
+
+    def test_prefix_suffix_and_substring(self):
+        """Test patterns with edge wildcards."""
+        self.assertTrue(get_simple_matcher("*.PY")("a/b.py"))
+        self.assertTrue(get_simple_matcher("test_*")("Test_a.py"))
+        self.assertTrue(get_simple_matcher("*conf*")("my.CONF.ini"))
+        self.assertFalse(get_simple_matcher("*conf*")("settings.ini"))
+
+    def test_needs_regex(self):
+        """Test inner wildcards and non-ASCII patterns fall back to regex."""
+        self.assertIsNone(get_simple_matcher("a*b"))
+        self.assertIsNone(get_simple_matcher("file?.txt"))
+        self.assertIsNone(get_simple_matcher("ünïcode*"))
+        self.assertIsNone(get_simple_matcher(None))
+
+
+class TestFileCriteriaPatterns(unittest.TestCase):
+    """Tests for FileCriteriaPatterns."""
+
+    def test_matches(self):
+        """Test matching with simple and wildcard criteria combined."""
+        patterns = FileCriteriaPatterns.from_criteria(
+            SearchCriteria(search_query="", filename="*_test*", extension="py", path="src/*")
+        )
+        self.assertTrue(patterns.matches("a_test.py", "src/a_test.py"))
+        self.assertFalse(patterns.matches("a_test.py", "lib/a_test.py"))
+        self.assertFalse(patterns.matches("a_test.js", "src/a_test.js"))
+
+    def test_shares_compiled_patterns(self):
+        """Test criteria with equal globs reuse the same compiled regexes."""
+        first = FileCriteriaPatterns.from_criteria(
+            SearchCriteria(search_query="a", filename="*.md", extension="py")
+        )
+        second = FileCriteriaPatterns.from_criteria(
+            SearchCriteria(search_query="b", filename="*.md", extension=".py")
+        )
+        self.assertIs(first.filename, second.filename)
+        self.assertIs(first.extension, second.extension)
+
+    def test_wildcard_fallback(self):
+        """Test criteria with inner wildcards are matched by regex."""
+        patterns = FileCriteriaPatterns.from_criteria(
+            SearchCriteria(search_query="", filename="a*b.txt")
+        )
+        self.assertIsNone(patterns.filename_matcher)
+        self.assertTrue(patterns.matches("A-B.txt", "A-B.txt"))
+        self.assertFalse(patterns.matches("a-c.txt", "a-c.txt"))
+
+
+
+class TestGetNextPaginationUrl(unittest.TestCase):
+    """Tests for get_next_pagination_url function."""
+
+    def test_next_link(self):
+        """Test next URL is found among other relations."""
+        link = (
+            '<https://x/api/v4/groups?page=1>; rel="prev", '
+            '<https://x/api/v4/groups?page=3>; rel="next", '
+            '<https://x/api/v4/groups?page=9>; rel="last"'
+        )
+        response = Response(status=200, headers={"link": link}, body=b"")
+        self.assertEqual(get_next_pagination_url(response), "https://x/api/v4/groups?page=3")
+
+    def test_no_next_link(self):
+        """Test last page has no next URL."""
+        response = Response(status=200, headers={"Link": '<https://x/a?page=1>; rel="first"'}, body=b"")
+        self.assertIsNone(get_next_pagination_url(response))
+        self.assertIsNone(get_next_pagination_url(Response(status=200, headers={}, body=b"")))
+
+
+class TestResponse(unittest.TestCase):
+    """Tests for Response."""
+
+    def test_get_header(self):
+        """Test case-insensitive lookup in response messages and plain dicts."""
+        message = http.client.HTTPMessage()
+        message["X-Total-Pages"] = "3"
+        self.assertEqual(Response(200, message, b"").get_header("x-total-pages"), "3")
+        self.assertEqual(Response(200, {"ETag": "x"}, b"").get_header("etag"), "x")
+        self.assertIsNone(Response(200, message, b"").get_header("Link"))
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Tests for RateLimiter."""
+
+    def test_limits_rate_after_burst(self):
+        """Test requests beyond the burst capacity wait for new tokens."""
+        async def acquire_all():
+            limiter = RateLimiter(rate=50, capacity=2)
+            start = time.monotonic()
+            for _ in range(4):
+                await limiter.acquire()
+            return time.monotonic() - start
+
+        # Two requests pass immediately, two more wait 1/50 s each
+        self.assertGreaterEqual(asyncio.run(acquire_all()), 0.035)
+
+
+class FakeHTTPResponse(io.BytesIO):
+    """Response body stub with optional Content-Length."""
+
+    def __init__(self, body: bytes, length: int | None = None) -> None:
+        super().__init__(body)
+        self.length = length
+
+
+class TestReadBody(unittest.TestCase):
+    """Tests for read_body function."""
+
+    def test_reads_whole_body(self):
+        """Test bodies within the limit are read completely."""
+        body = b"x" * 200000
+        self.assertEqual(read_body(FakeHTTPResponse(body)), body)
+        self.assertEqual(read_body(FakeHTTPResponse(body), max_bytes=200000), body)
+
+    def test_limit_exceeded(self):
+        """Test oversized bodies are rejected with and without Content-Length."""
+        with self.assertRaises(ResponseTooLargeError):
+            read_body(FakeHTTPResponse(b"", length=200001), max_bytes=200000)
+        with self.assertRaises(ResponseTooLargeError):
+            read_body(FakeHTTPResponse(b"x" * 200001), max_bytes=200000)
+
+
+class TestGatherAll(unittest.TestCase):
+    """Tests for gather_all function."""
+
+    def test_results_in_order(self):
+        """Test results keep the order of the coroutines."""
+        async def value(result: int, delay: float) -> int:
+            await asyncio.sleep(delay)
+            return result
+
+        results = asyncio.run(gather_all([value(1, 0.01), value(2, 0)]))
+        self.assertEqual(results, [1, 2])
+
+    def test_first_error_cancels_siblings(self):
+        """Test the original error is raised and running siblings are cancelled."""
+        async def fail():
+            raise ValueError("denied")
+
+        async def run():
+            slow = asyncio.ensure_future(asyncio.sleep(10))
+            with self.assertRaisesRegex(ValueError, "denied"):
+                await gather_all([fail(), asyncio.wait_for(slow, 20)])
+            return slow.cancelled()
+
+        self.assertTrue(asyncio.run(run()))
+
+
+class FakeConnection:
+    """Connection stub answering requests with replies from a shared script.
+
+    The script is a list of replies used in order, or a dict of replies
+    by request target. Each reply is a (status, headers, body) tuple, or
+    an exception raised when the request is sent.
+    """
+
+    def __init__(self, script: list, sent: list) -> None:
+        self.script = script
+        self.sent = sent
+        self.closed = False
+
+    def request(self, method, target, body=None, headers=None):
+        self.sent.append((self, method, target, body, dict(headers or {})))
+        if isinstance(self.script, dict):
+            self.reply = self.script[target]
+        else:
+            self.reply = self.script.pop(0)
+        if isinstance(self.reply, Exception):
+            raise self.reply
+
+    def getresponse(self):
+        status, headers, body = self.reply
+        resp = FakeHTTPResponse(body)
+        resp.status = status
+        resp.headers = http.client.HTTPMessage()
+        for name, value in headers.items():
+            resp.headers[name] = value
+        resp.will_close = False
+        return resp
+
+    def close(self):
+        self.closed = True
+
+
+class StubClient(GitLabClient):
+    """GitLab client sending requests over FakeConnections."""
+
+    def __init__(self, script: list, **options) -> None:
+        options.setdefault("cache_ttl", 0)
+        super().__init__(Config(api_url="https://gitlab.test/api/v4", token="secret", **options))
+        self.script = script
+        self.sent: list = []
+        self.connections: list[FakeConnection] = []
+
+    def _new_connection(self, scheme, netloc):
+        conn = FakeConnection(self.script, self.sent)
+        self.connections.append(conn)
+        return conn
+
+
+class RecordingClient(StubClient):
+    """Stub client recording the shared task of each requested URL."""
+
+    def __init__(self, script, **options) -> None:
+        super().__init__(script, **options)
+        self.request_tasks: dict[str, asyncio.Task] = {}
+
+    async def _request_with_retry(self, url):
+        self.request_tasks[url] = asyncio.current_task()
+        return await super()._request_with_retry(url)
+
+
+class TestSendSync(unittest.TestCase):
+    """Tests for GitLabClient._send_sync."""
+
+    def client(self, script: list, **options) -> StubClient:
+        client = StubClient(script, **options)
+        self.addCleanup(client.close)
+        return client
+
+    def test_reuses_connection(self):
+        """Test requests to the same host share one keep-alive connection."""
+        client = self.client([(200, {}, b"a"), (200, {}, b"b")])
+        client._send_sync("GET", "https://gitlab.test/a")
+        client._send_sync("GET", "https://gitlab.test/b")
+
+        self.assertEqual(len(client.connections), 1)
+        self.assertEqual([target for _, _, target, _, _ in client.sent], ["/a", "/b"])
+
+    def test_reconnects_closed_connection(self):
+        """Test a reused connection closed by the server is retried on a new one."""
+        client = self.client([(200, {}, b"a"), ConnectionResetError(), (200, {}, b"b")])
+        client._send_sync("GET", "https://gitlab.test/a")
+        response = client._send_sync("GET", "https://gitlab.test/b")
+
+        self.assertEqual(response.body, b"b")
+        first, second = client.connections
+        self.assertTrue(first.closed)
+        self.assertFalse(second.closed)
+
+    def test_new_connection_error_raised(self):
+        """Test errors on a fresh connection are not retried."""
+        client = self.client([ConnectionRefusedError()])
+        with self.assertRaises(ConnectionRefusedError):
+            client._send_sync("GET", "https://gitlab.test/a")
+        self.assertTrue(client.connections[0].closed)
+
+    def test_follows_redirects(self):
+        """Test relative redirects are followed with the same method and body."""
+        client = self.client([
+            (307, {"Location": "/api/v4/other"}, b""),
+            (200, {}, b"ok"),
+        ])
+        response = client._send_sync("POST", "https://gitlab.test/api/v4/graphql", body=b"{}")
+
+        self.assertEqual(response.body, b"ok")
+        self.assertEqual(
+            [(method, target, body) for _, method, target, body, _ in client.sent],
+            [("POST", "/api/v4/graphql", b"{}"), ("POST", "/api/v4/other", b"{}")],
+        )
+
+    def test_see_other_drops_body(self):
+        """Test 301/302/303 redirects of POST requests continue as GET without body."""
+        client = self.client([
+            (302, {"Location": "https://gitlab.test/next"}, b""),
+            (200, {}, b"ok"),
+        ])
+        client._send_sync(
+            "POST", "https://gitlab.test/api/v4/graphql", body=b"{}",
+            headers={"Content-Type": "application/json"},
+        )
+
+        _, method, target, body, headers = client.sent[1]
+        self.assertEqual((method, target, body), ("GET", "/next", None))
+        self.assertNotIn("Content-Type", headers)
+        self.assertEqual(headers["PRIVATE-TOKEN"], "secret")
+
+    def test_redirect_loop(self):
+        """Test redirect loops stop with HTTPError after MAX_REDIRECTS hops."""
+        client = self.client([(302, {"Location": "/loop"}, b"")] * (MAX_REDIRECTS + 5))
+
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            client._send_sync("GET", "https://gitlab.test/loop")
+        self.assertEqual(ctx.exception.code, 302)
+        self.assertEqual(len(client.sent), MAX_REDIRECTS + 1)
+
+
+
+
+class TestRequestSync(unittest.TestCase):
+    """Tests for GitLabClient._request_sync response caching."""
+
+    url = "https://gitlab.test/api/v4/groups"
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def client(self, script: list, ttl: int) -> StubClient:
+        client = StubClient(script)
+        self.addCleanup(client.close)
+        client.cache = ResponseCache(Path(self.tmpdir.name), "secret")
+        client.config.cache_ttl = ttl
+        client.cache.put(self.url, {"ETag": '"v1"'}, b"[1]")
+        return client
+
+    def test_fresh_entry_served_from_cache(self):
+        """Test fresh entries are returned without a request."""
+        client = self.client([], ttl=300)
+
+        self.assertEqual(client._request_sync(self.url).body, b"[1]")
+        self.assertEqual(client.sent, [])
+
+    def test_not_modified_revalidates_entry(self):
+        """Test stale entries are revalidated with their ETag."""
+        client = self.client([(304, {}, b"")], ttl=0)
+        response = client._request_sync(self.url)
+
+        self.assertEqual((response.status, response.body), (200, b"[1]"))
+        self.assertEqual(client.sent[0][4]["If-None-Match"], '"v1"')
+
+    def test_modified_entry_replaced(self):
+        """Test a changed response replaces the cached entry."""
+        client = self.client([(200, {"ETag": '"v2"'}, b"[2]")], ttl=0)
+
+        self.assertEqual(client._request_sync(self.url).body, b"[2]")
+        self.assertEqual(client.cache.get(self.url).etag, '"v2"')
+
+    def test_tree_cached_only_if_enabled(self):
+        """Test repository tree responses bypass the cache unless opted in."""
+        url = "https://gitlab.test/api/v4/projects/1/repository/tree?recursive=true&ref=main"
+        client = self.client([(200, {}, b"[]"), (200, {}, b"[]")], ttl=300)
+
+        client._request_sync(url)
+        self.assertIsNone(client.cache.get(url))
+
+        client.config.cache_search = True
+        client._request_sync(url)
+        self.assertEqual(client.cache.get(url).body, b"[]")
+
+
+class TestRequest(unittest.TestCase):
+    """Tests for GitLabClient._request retries and coalescing."""
+
+    url = "https://gitlab.test/api/v4/groups"
+
+    def request_all(self, script: list, count: int = 1) -> tuple[StubClient, list]:
+        client = StubClient(script)
+        self.addCleanup(client.close)
+
+        async def run():
+            return await asyncio.gather(*(client._request(self.url) for _ in range(count)))
+
+        return client, asyncio.run(run())
+
+    def test_retries_unavailable(self):
+        """Test rate limited and unavailable responses are retried."""
+        client, (response,) = self.request_all([
+            (429, {"Retry-After": "0"}, b""),
+            (503, {"Retry-After": "0"}, b""),
+            (200, {}, b"ok"),
+        ])
+        self.assertEqual(response.body, b"ok")
+        self.assertEqual(len(client.sent), 3)
+
+    def test_gives_up_after_max_retries(self):
+        """Test last failed response is returned after MAX_RETRIES retries."""
+        client, (response,) = self.request_all(
+            [(502, {"Retry-After": "0"}, b"")] * (MAX_RETRIES + 1)
+        )
+        self.assertEqual(response.status, 502)
+        self.assertEqual(len(client.sent), MAX_RETRIES + 1)
+
+    def test_coalesces_identical_requests(self):
+        """Test concurrent requests for one URL share a single request."""
+        client, responses = self.request_all([(200, {}, b"ok")], count=3)
+
+        self.assertEqual([r.body for r in responses], [b"ok"] * 3)
+        self.assertEqual(len(client.sent), 1)
+        self.assertEqual(client._inflight, {})
+
+    def test_sibling_error_cancels_shared_request(self):
+        """Test a failing sibling cancels the request itself, not only its caller."""
+        client = RecordingClient({
+            "/api/v4/denied": (403, {}, b""),
+            "/api/v4/busy": (503, {"Retry-After": "10"}, b""),
+        })
+        self.addCleanup(client.close)
+
+        async def fail():
+            response = await client._request("https://gitlab.test/api/v4/denied")
+            response.raise_for_status()
+
+        async def run():
+            with self.assertRaises(urllib.error.HTTPError):
+                await gather_all([fail(), client._request("https://gitlab.test/api/v4/busy")])
+            await asyncio.sleep(0)
+
+        asyncio.run(run())
+        busy = client.request_tasks["https://gitlab.test/api/v4/busy"]
+        self.assertTrue(busy.cancelled())
+        self.assertEqual(client._inflight, {})
+        # The 503 was not retried after its backoff
+        busy_sent = [sent for sent in client.sent if sent[2] == "/api/v4/busy"]
+        self.assertLessEqual(len(busy_sent), 1)
+
+    def test_cancelled_waiter_keeps_shared_request(self):
+        """Test the request continues while another caller still awaits it."""
+        client = RecordingClient([(200, {}, b"ok")])
+        self.addCleanup(client.close)
+
+        async def run():
+            first = asyncio.ensure_future(client._request(self.url))
+            second = asyncio.ensure_future(client._request(self.url))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        self.assertEqual(asyncio.run(run()).body, b"ok")
+        self.assertFalse(client.request_tasks[self.url].cancelled())
+
+    def test_retry_delay(self):
+        """Test Retry-After is honoured and backoff grows exponentially."""
+        self.assertEqual(get_retry_delay(Response(429, {"Retry-After": "7"}, b""), 0), 7)
+        self.assertEqual(get_retry_delay(Response(503, {}, b""), 0), RETRY_BASE_DELAY)
+        self.assertEqual(get_retry_delay(Response(503, {}, b""), 2), RETRY_BASE_DELAY * 4)
+
+
+def graphql_project(project_id: int, namespace: str, namespace_id: int) -> dict:
+    """Build project node of a GraphQL group projects response."""
+    path = f"{namespace}/p{project_id}"
+    return {
+        "id": f"gid://gitlab/Project/{project_id}",
+        "name": f"p{project_id}",
+        "fullPath": path,
+        "webUrl": f"https://gitlab.test/{path}",
+        "archived": False,
+        "namespace": {"id": f"gid://gitlab/Group/{namespace_id}", "fullPath": namespace},
+    }
+
+
+def graphql_reply(nodes: list[dict]) -> tuple[int, dict, bytes]:
+    """Build single page GraphQL group projects reply."""
+    data = {"data": {"group": {"projects": {
+        "nodes": nodes, "pageInfo": {"hasNextPage": False, "endCursor": None},
+    }}}}
+    return 200, {}, json.dumps(data).encode()
+
+
+class TestFetchProjectsInGroups(unittest.TestCase):
+    """Tests for GitLabClient.fetch_projects_in_groups."""
+
+    def fetch(self, script: list, group: Group, exclude_groups: list[str]):
+        client = StubClient(script)
+        self.addCleanup(client.close)
+        projects = asyncio.run(client.fetch_projects_in_groups(
+            [group], recursive=True, exclude_groups=exclude_groups
+        ))
+        return client, [p.id for p in projects]
+
+    def test_graphql_excludes_group_by_display_name(self):
+        """Test a top-level group excluded by display name loses its own projects."""
+        _, ids = self.fetch(
+            [graphql_reply([graphql_project(1, "top", 10), graphql_project(2, "top/sub", 11)])],
+            Group(id="10", name="Top Group", full_path="top"),
+            ["Top Group"],
+        )
+        self.assertEqual(ids, [2])
+
+    def test_graphql_excludes_subgroup_by_path(self):
+        """Test subgroups are excluded by full path or ID."""
+        nodes = [
+            graphql_project(1, "top", 10),
+            graphql_project(2, "top/sub", 11),
+            graphql_project(3, "top/other", 12),
+        ]
+        group = Group(id="10", name="Top Group", full_path="top")
+        self.assertEqual(self.fetch([graphql_reply(nodes)], group, ["top/sub"])[1], [1, 3])
+        self.assertEqual(self.fetch([graphql_reply(nodes)], group, ["12"])[1], [1, 2])
+
+    def test_graphql_omits_shared_projects(self):
+        """Test GraphQL lists only projects in the group tree, not shared ones."""
+        client, ids = self.fetch(
+            [graphql_reply([graphql_project(1, "top", 10)])],
+            Group(id="10", name="Top Group", full_path="top"),
+            [],
+        )
+        self.assertEqual(ids, [1])
+        self.assertEqual(len(client.sent), 1)
+        query = json.loads(client.sent[0][3])["query"]
+        self.assertIn("projects(includeSubgroups: true", query)
+        self.assertNotIn("sharedProjects", query)
+
+    def test_falls_back_to_rest(self):
+        """Test GraphQL errors fall back to REST descendant group expansion."""
+        def rest_projects(*ids: int) -> tuple[int, dict, bytes]:
+            return 200, {}, json.dumps([
+                {"id": i, "name": f"p{i}", "web_url": f"https://gitlab.test/p{i}",
+                 "path_with_namespace": f"top/p{i}"}
+                for i in ids
+            ]).encode()
+
+        script = {
+            "/api/graphql": (200, {}, b'{"errors": [{"message": "disabled"}]}'),
+            "/api/v4/groups/10/projects?per_page=100": rest_projects(1),
+            "/api/v4/groups/10/descendant_groups?per_page=100&all_available=true": (
+                200, {}, b'[{"id": 11, "full_path": "top/sub"}, {"id": 12, "full_path": "top/other"}]'
+            ),
+            "/api/v4/groups/11/projects?per_page=100": rest_projects(2),
+            "/api/v4/groups/12/projects?per_page=100": rest_projects(3),
+        }
+        client, ids = self.fetch(
+            script, Group(id="10", name="Top Group", full_path="top"), ["top/other"]
+        )
+        self.assertEqual(ids, [1, 2])
+        self.assertEqual(client.sent[0][1:3], ("POST", "/api/graphql"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+"""Tests for the output module."""
+
+import contextlib
+import io
+import unittest
+
+from gitlab_search.gitlab import Project, SearchResult
+from gitlab_search.output import (
+    PARALLEL_FORMAT_MIN_RESULTS,
+    ColorFormatter,
+    ResultPrinter,
+    extract_snippet,
+    highlight_literal,
+)
+
+
+class TestHighlightSearchQuery(unittest.TestCase):
+    """Tests for ResultPrinter.highlight_search_query."""
+
+    def test_highlights_case_insensitively(self):
+        """Test matches are wrapped in red keeping their original case."""
+        printer = ResultPrinter(ColorFormatter("always"))
+        red, reset = ColorFormatter.RED, ColorFormatter.RESET
+        self.assertEqual(
+            printer.highlight_search_query(["foo", "bar"], "Foo(x) + bar"),
+            f"{red}Foo{reset}(x) + {red}bar{reset}",
+        )
+
+    def test_without_colors(self):
+        """Test text with backslashes is returned unchanged without colors."""
+        printer = ResultPrinter(ColorFormatter("never"))
+        self.assertEqual(printer.highlight_search_query("a", r"a\1 \n a"), r"a\1 \n a")
+
+    def test_indent(self):
+        """Test continuation lines are indented with and without colors."""
+        red, reset = ColorFormatter.RED, ColorFormatter.RESET
+        printer = ResultPrinter(ColorFormatter("always"))
+        self.assertEqual(
+            printer.highlight_search_query(["a", "b"], "a\nb\nc", indent=True),
+            f"{red}a{reset}\n\t\t{red}b{reset}\n\t\tc",
+        )
+        self.assertEqual(
+            printer.highlight_search_query("x", "İ\nx", indent=True),
+            f"İ\n\t\t{red}x{reset}",
+        )
+        printer = ResultPrinter(ColorFormatter("never"))
+        self.assertEqual(printer.highlight_search_query("a", "a\nb", indent=True), "a\n\t\tb")
+
+    def test_non_ascii(self):
+        """Test non-ASCII text is highlighted with and without the regex fallback."""
+        printer = ResultPrinter(ColorFormatter("always"))
+        red, reset = ColorFormatter.RED, ColorFormatter.RESET
+        self.assertEqual(printer.highlight_search_query("é", "É é"), f"{red}É{reset} {red}é{reset}")
+        self.assertEqual(printer.highlight_search_query("x", "İ x"), f"İ {red}x{reset}")
+        self.assertIn("x", printer._highlight_patterns)
+
+    def test_unicode_case_folding(self):
+        """Test non-ASCII case variants match like re.IGNORECASE."""
+        printer = ResultPrinter(ColorFormatter("always"))
+        red, reset = ColorFormatter.RED, ColorFormatter.RESET
+        self.assertEqual(
+            printer.highlight_search_query("s", "ſ S"), f"{red}ſ{reset} {red}S{reset}"
+        )
+        self.assertEqual(
+            printer.highlight_search_query("σ", "Σς"), f"{red}Σ{reset}{red}ς{reset}"
+        )
+        self.assertEqual(printer.highlight_search_query("i", "İ"), f"{red}İ{reset}")
+
+
+class TestPrintBlobResults(unittest.TestCase):
+    """Tests for ResultPrinter.print_blob_results."""
+
+    def print_results(self, printer: ResultPrinter, count: int) -> str:
+        project = Project(1, "p", "https://gitlab.test/g/p", False, "g/p")
+        results = [
+            SearchResult(data=f"foo {i}\nbar", filename=f"f{i}.py", ref="main", startline=i)
+            for i in range(count)
+        ]
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            printer.print_blob_results(["foo"], [(project, results)])
+        return out.getvalue()
+
+    def test_parallel_formatting(self):
+        """Test formatting in worker threads keeps the output and is shut down."""
+        # Several chunks and a partial last one
+        count = PARALLEL_FORMAT_MIN_RESULTS * 2 + 1
+        expected = self.print_results(ResultPrinter(ColorFormatter("always"), parallel=False), count)
+
+        with ResultPrinter(ColorFormatter("always"), parallel=True) as printer:
+            self.assertEqual(self.print_results(printer, count), expected)
+            executor = printer._format_executor
+            self.assertIsNotNone(executor)
+        self.assertIsNone(printer._format_executor)
+        with self.assertRaises(RuntimeError):
+            executor.submit(print)
+
+    def test_small_projects_not_parallel(self):
+        """Test few results are formatted without starting worker threads."""
+        with ResultPrinter(ColorFormatter("never"), parallel=True) as printer:
+            self.print_results(printer, 3)
+            self.assertIsNone(printer._format_executor)
+
+
+class TestHighlightLiteral(unittest.TestCase):
+    """Tests for highlight_literal function."""
+
+    def test_wraps_all_occurrences(self):
+        """Test every non-overlapping occurrence is wrapped in original case."""
+        self.assertEqual(highlight_literal("aXa xax", "xa", "<", ">"), "a<Xa> <xa>x")
+        self.assertEqual(highlight_literal("aaaa", "aa", "<", ">"), "<aa><aa>")
+
+    def test_no_occurrence(self):
+        """Test text without the query is returned unchanged."""
+        self.assertEqual(highlight_literal("abc", "d", "<", ">"), "abc")
+
+    def test_non_ascii_refused(self):
+        """Test non-ASCII text or query is left to the regex fallback."""
+        self.assertIsNone(highlight_literal("İx", "x", "<", ">"))
+        self.assertIsNone(highlight_literal("ſ s", "s", "<", ">"))
+        self.assertIsNone(highlight_literal("abc", "é", "<", ">"))
+
+
+class TestExtractSnippet(unittest.TestCase):
+    """Tests for extract_snippet function."""
+
+    def test_earliest_query(self):
+        """Test snippet is centered on the earliest match of any query."""
+        text = "a" * 20 + "Bar" + "b" * 5 + "foo" + "c" * 20
+        self.assertEqual(
+            extract_snippet(text, ["foo", "bar"], context_chars=5),
+            "...aaaaaBarbbbbb...",
+        )
+
+    def test_no_match(self):
+        """Test None is returned without any match."""
+        self.assertIsNone(extract_snippet("text", ["y", ""]))
+        self.assertIsNone(extract_snippet("text", []))
+
+    def test_length_changing_text(self):
+        """Test text changing length when lowercased falls back to regex."""
+        self.assertEqual(extract_snippet("İ" * 5 + "x", "X", context_chars=2), "...İİx")
+
+    def test_unicode_case_folding(self):
+        """Test non-ASCII case variants are found like with re.IGNORECASE."""
+        text = "a" * 10 + "ſ" + "s" * 10
+        self.assertEqual(extract_snippet(text, "S", context_chars=1), "...aſs...")
+        self.assertEqual(extract_snippet("xx ς σ", "Σ", context_chars=0), "...ς...")
+
+
+if __name__ == "__main__":
+    unittest.main()
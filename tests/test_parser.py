@@ -157,6 +157,11 @@ class TestTokenizeArgs(unittest.TestCase):
 
         self.assertFalse(result.recursive)
 
+    def test_cache_flag(self):
+        """Test --cache flag in tokenizer."""
+        self.assertTrue(tokenize_args(["--cache", "-q", "x"]).cache)
+        self.assertFalse(tokenize_args(["-q", "x"]).cache)
+
     def test_missing_query_argument(self):
         """Test error on missing -q argument."""
         with self.assertRaises(ParseError) as ctx:
@@ -183,6 +188,20 @@ class TestExpressionParser(unittest.TestCase):
         self.assertIsInstance(result, QueryNode)
         self.assertEqual(result.query, "foo")
 
+    def test_repeated_query_shares_node(self):
+        """Test repeated queries are parsed into one shared leaf."""
+        tokens = [
+            Token(TokenType.QUERY, "a"),
+            Token(TokenType.OR),
+            Token(TokenType.NOT),
+            Token(TokenType.QUERY, "a"),
+            Token(TokenType.EOF)
+        ]
+        result = ExpressionParser(tokens).parse()
+
+        self.assertIsInstance(result, OrNode)
+        self.assertIs(result.left, result.right.child)
+
     def test_implicit_and(self):
         """Test implicit AND between queries."""
         tokens = [